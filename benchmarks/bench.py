@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" bench -> translation benchmarks for java2python.
+
+This script translates the Java sources of the test directory, the
+sources given, and generated sources (of 1 and 10 thousand lines when
+no sources are given), one phase at a time, and reports for each phase
+(parse, transform, visit and encode) its time per thousand lines of
+source and the peak memory of the process.  The results are written as
+JSON and can be compared with a saved baseline:
+
+    $ python bench.py -o baseline.json
+    $ python bench.py -o results.json -b baseline.json
+
+The exit status is non-zero when a phase got slower, or used more
+memory, than the thresholds allow.  Each run of each source is made in
+a new process, so the memory of one does not show in the next.  No JDK
+is needed.
+"""
+import sys
+from glob import glob
+from json import dump, load
+from multiprocessing import Pool
+from optparse import OptionParser
+from os import path
+from platform import platform, python_version
+from resource import RUSAGE_SELF, getrusage
+from time import strftime, time
+
+rootDir = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from java2python.compiler import Translator
+from java2python.config import Config
+from java2python.lang import FastLexer, Lexer, tokens
+
+import javagen
+
+
+phases = ('parse', 'transform', 'visit', 'encode')
+resultsFormat = 1
+
+## the config and lexer used by the benchmark processes; set before they fork.
+translationConfig, translationLexer = None, Lexer
+
+
+def peakKB():
+    """ Returns the peak resident set size of this process in kilobytes. """
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def readSource(spec):
+    """ Returns the source for the given (kind, name, value) input spec. """
+    kind, name, value = spec
+    if kind == 'generated':
+	return javagen.largeClass(name, value)
+    with open(value) as fh:
+	return fh.read()
+
+
+class PhaseTranslator(Translator):
+    """ PhaseTranslator -> a Translator that samples the peak memory after each phase. """
+    validate = False
+
+    def translate(self, source, name=None, filename=None):
+	""" Translates the source; the peaks of its phases are kept in `peaks`. """
+	self.peaks = {}
+	return Translator.translate(self, source, name, filename)
+
+    def timePhase(self, timings, phase, started):
+	""" Records the time of a phase and the peak memory at its end. """
+	Translator.timePhase(self, timings, phase, started)
+	self.peaks[phase] = peakKB()
+	return time()
+
+
+def translatePhases(source, name, filename=None, dump=False):
+    """ Translates the given source and returns the time and memory of each phase.
+
+    With `dump`, the time of writing the debug dump of the AST is
+    included as a 'dump' phase.
+    """
+    translator = PhaseTranslator(translationConfig, translationLexer)
+    result = translator.translate(source, name, filename)
+    marks = dict((phase, dict(seconds=result.timings[phase], peakKB=translator.peaks[phase]))
+		 for phase in phases)
+    if dump:
+	started = time()
+	result.tree.dumps()
+	marks['dump'] = dict(seconds=time() - started, peakKB=peakKB())
+    return marks
+
+
+def runOne(spec):
+    """ Runs the benchmark of one input spec in the current process. """
+    startKB = peakKB()
+    source = readSource(spec)
+    result = dict(name=spec[1], lines=len(source.splitlines()), startKB=startKB)
+    filename = spec[2] if spec[0] == 'file' else None
+    try:
+	result['phases'] = translatePhases(source, path.splitext(path.basename(spec[1]))[0], filename)
+    except (Exception, ), exc:
+	result['error'] = '{0}: {1}'.format(type(exc).__name__, exc)
+    return result
+
+
+def mergeRuns(runs):
+    """ Returns one result from repeated runs: the best times and the worst memory.
+
+    The result is the first error if any of the runs failed.
+    """
+    failed = [run for run in runs if 'error' in run]
+    result = dict(failed[0] if failed else runs[0])
+    del result['startKB']
+    if failed:
+	return result
+    merged = {}
+    for phase in phases:
+	items = [run['phases'][phase] for run in runs]
+	peak = max(item['peakKB'] for item in items)
+	merged[phase] = dict(
+	    seconds=min(item['seconds'] for item in items),
+	    peakKB=peak,
+	    growthKB=max(0, peak - min(run['startKB'] for run in runs)),
+	)
+    result['phases'] = merged
+    addRates(result)
+    return result
+
+
+def addRates(result):
+    """ Adds the milliseconds per thousand lines to each phase of a result. """
+    kloc = max(result['lines'], 1) / 1000.0
+    for item in result['phases'].values():
+	item['msPerKloc'] = item['seconds'] * 1000.0 / kloc
+
+
+def totalResult(results):
+    """ Returns the sums of the times and the maximum memory of the results. """
+    good = [r for r in results if 'error' not in r]
+    total = dict(name='total', lines=sum(r['lines'] for r in good), phases={})
+    for phase in phases:
+	items = [r['phases'][phase] for r in good]
+	total['phases'][phase] = dict(
+	    seconds=sum(item['seconds'] for item in items),
+	    peakKB=max([item['peakKB'] for item in items] or [0]),
+	    growthKB=max([item['growthKB'] for item in items] or [0]),
+	)
+    addRates(total)
+    return total
+
+
+def inputSpecs(options, args):
+    """ Returns the (kind, name, value) specs of the inputs to benchmark. """
+    specs = []
+    if options.tests:
+	names = glob(path.join(rootDir, 'test', '*.java'))
+	names += glob(path.join(rootDir, 'test', '*', '*.java'))
+	specs.extend(('file', path.relpath(n, rootDir), n) for n in sorted(names))
+    for name in args:
+	if path.isdir(name):
+	    names = sorted(glob(path.join(name, '*.java')))
+	else:
+	    names = [name]
+	specs.extend(('file', n, n) for n in names)
+    for kloc in options.generated:
+	lines = int(kloc * 1000)
+	specs.append(('generated', 'Generated{0}'.format(lines), lines))
+    return specs
+
+
+def runAll(specs, repeat):
+    """ Runs the benchmarks of the given specs, each run in a new process. """
+    pool = Pool(processes=1, maxtasksperchild=1)
+    try:
+	results = []
+	for spec in specs:
+	    runs = [pool.apply(runOne, (spec, )) for i in range(repeat)]
+	    results.append(mergeRuns(runs))
+	pool.close()
+    except:
+	pool.terminate()
+	raise
+    pool.join()
+    return results
+
+
+def compareResults(results, baseline, options):
+    """ Returns the lines describing the regressions against the baseline. """
+    old = dict((r['name'], r) for r in baseline['inputs'] + [baseline['total']])
+    lines, minSeconds = [], options.mintime / 1000.0
+    for new in results['inputs'] + [results['total']]:
+	base = old.get(new['name'])
+	if not base or 'error' in base or 'error' in new:
+	    continue
+	for phase in phases:
+	    a, b = base['phases'][phase], new['phases'][phase]
+	    if b['seconds'] >= minSeconds and a['msPerKloc'] > 0:
+		change = (b['msPerKloc'] / a['msPerKloc'] - 1) * 100
+		if change > options.timethreshold:
+		    lines.append('{0} {1}: {2:.1f} -> {3:.1f} ms/KLOC ({4:+.0f}%)'.format(
+			new['name'], phase, a['msPerKloc'], b['msPerKloc'], change))
+	    if b['growthKB'] >= options.minmemory and a['growthKB'] > 0:
+		change = (float(b['growthKB']) / a['growthKB'] - 1) * 100
+		if change > options.memorythreshold:
+		    lines.append('{0} {1}: {2} -> {3} KB memory growth ({4:+.0f}%)'.format(
+			new['name'], phase, a['growthKB'], b['growthKB'], change))
+    return lines
+
+
+def formatTable(results):
+    """ Returns the lines of a table of the results, in ms per KLOC. """
+    fs = '{0:<32} {1:>7} {2:>10} {3:>10} {4:>10} {5:>10} {6:>9}'
+    lines = [fs.format('input', 'lines', *(phases + ('peak MB', )))]
+    for result in results['inputs'] + [results['total']]:
+	if 'error' in result:
+	    lines.append('{0:<32} {1}'.format(result['name'], result['error']))
+	    continue
+	items = [result['phases'][phase] for phase in phases]
+	rates = ['{0:.1f}'.format(item['msPerKloc']) for item in items]
+	peak = '{0:.1f}'.format(max(item['peakKB'] for item in items) / 1024.0)
+	lines.append(fs.format(result['name'][-32:], result['lines'], *(rates + [peak])))
+    return lines
+
+
+def main(options, args):
+    """ Runs the benchmarks and compares them with the baseline, if any. """
+    global translationConfig, translationLexer
+    translationConfig = Config(['java2python.config.default'] + options.configs)
+    translationLexer = FastLexer if options.fastlexer else Lexer
+    tokens.map # load the parser before the benchmark processes fork
+    inputs = runAll(inputSpecs(options, args), options.repeat)
+    results = dict(
+	format=resultsFormat,
+	created=strftime('%Y-%m-%dT%H:%M:%S'),
+	python=python_version(),
+	platform=platform(),
+	configs=options.configs,
+	lexer=translationLexer.__name__,
+	repeat=options.repeat,
+	inputs=inputs,
+	total=totalResult(inputs),
+    )
+    if not options.quiet:
+	print '\n'.join(formatTable(results))
+    if options.output:
+	with open(options.output, 'w') as fh:
+	    dump(results, fh, indent=1, sort_keys=True)
+    status = 1 if any('error' in r for r in inputs) else 0
+    if options.baseline:
+	with open(options.baseline) as fh:
+	    baseline = load(fh)
+	regressions = compareResults(results, baseline, options)
+	if regressions:
+	    print '\nRegressions against {0}:'.format(options.baseline)
+	    print '\n'.join(regressions)
+	    status = 2
+	elif not options.quiet:
+	    print '\nNo regressions against {0}.'.format(options.baseline)
+    return status
+
+
+def config(argv):
+    """ Returns the options and arguments from the given argument sequence. """
+    parser = OptionParser(usage='%prog [options] [JAVA_FILE_OR_DIR ...]')
+    addopt = parser.add_option
+    addopt('-o', '--output', dest='output',
+	   help='Write the results as JSON to FILE.',
+	   metavar='FILE', default=None)
+    addopt('-b', '--baseline', dest='baseline',
+	   help='Compare the results with the JSON results in FILE.',
+	   metavar='FILE', default=None)
+    addopt('-c', '--config', dest='configs',
+	   help='Use CONFIG file or module with the defaults.  May be repeated.',
+	   metavar='CONFIG', default=[], action='append')
+    addopt('-g', '--generated', dest='generated',
+	   help='Add a generated source of KLOC thousand lines.  May be repeated.  '
+	   'Without files or directories, the default is 1 and 10; use 0 for none.',
+	   metavar='KLOC', default=[], type='float', action='append')
+    addopt('-n', '--no-tests', dest='tests',
+	   help='Skip the sources of the test directory.',
+	   default=True, action='store_false')
+    addopt('-r', '--repeat', dest='repeat',
+	   help='Run each source N times and keep the best times.',
+	   metavar='N', default=3, type='int')
+    addopt('-x', '--fast-lexer', dest='fastlexer',
+	   help='Tokenize with the regular expression lexer.',
+	   default=False, action='store_true')
+    addopt('-t', '--time-threshold', dest='timethreshold',
+	   help='Fail when a phase is more than PCT percent slower.',
+	   metavar='PCT', default=10.0, type='float')
+    addopt('-m', '--memory-threshold', dest='memorythreshold',
+	   help='Fail when a phase uses more than PCT percent more memory.',
+	   metavar='PCT', default=10.0, type='float')
+    addopt('--min-time', dest='mintime',
+	   help='Ignore the time of phases faster than MS milliseconds.',
+	   metavar='MS', default=5.0, type='float')
+    addopt('--min-memory', dest='minmemory',
+	   help='Ignore the memory of phases growing less than KB kilobytes.',
+	   metavar='KB', default=1024, type='int')
+    addopt('-q', '--quiet', dest='quiet',
+	   help='Do not print the results table.',
+	   default=False, action='store_true')
+    options, args = parser.parse_args(argv[1:])
+    if not (options.generated or args):
+	options.generated = [1.0, 10.0]
+    options.generated = [kloc for kloc in options.generated if kloc > 0]
+    if not (options.tests or args or options.generated):
+	parser.error('no sources to benchmark.')
+    return options, args
+
+
+if __name__ == '__main__':
+    sys.exit(main(*config(sys.argv)))
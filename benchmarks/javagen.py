@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" javagen -> generated Java sources for the benchmarks.
+
+The `largeClass` sources are made of the constructs the compiler
+handles most often: fields, comments, conditionals, loops, switch
+statements, method calls, string concatenation and array initializers.
+
+The functions in `axes` make sources that grow along one dimension
+that has been costly before, like the depth of nested statements or the
+number of comments.  Each takes a class name and a size N.  The same
+arguments always produce the same source.  To print one:
+
+    $ python javagen.py AXIS N
+"""
+import sys
+
+
+classHead = """\
+/**
+ * Generated source for benchmarks; {lines} lines requested.
+ */
+public class {name} {{
+    private int count = 0;
+    private String label = "start";
+    private int[] values = {{1, 2, 3, 4, 5, 6, 7, 8}};
+"""
+
+
+methodTemplate = """\
+
+    // method {i}: conditionals, loops and calls
+    public int method{i}(int a, String s) {{
+        int total = a + {i};
+        /* running label */
+        String text = s + "-" + total;
+        if (total > count && text.length() > 0) {{
+            count = count + 1;
+        }} else if (total == {i}) {{
+            count -= 2;
+        }} else {{
+            label = text;
+        }}
+        for (int k = 0; k < values.length; k++) {{
+            total += values[k] * k;
+        }}
+        while (total > 1000) {{
+            total = total / 2;
+        }}
+        switch (total % 3) {{
+            case 0:
+                total += 1;
+                break;
+            case 1:
+                total -= 1;
+                break;
+            default:
+                total = 0;
+        }}
+        int[] items = {{total, a, {i}, count}};
+        boolean big = total > 100 ? true : false;
+        System.out.println("method{i} " + total + " " + big + " " + items.length);
+        return big ? total : label.length();
+    }}
+"""
+
+
+def largeClass(name, lines):
+    """ Returns the source of a class with about the given number of lines. """
+    head = classHead.format(name=name, lines=lines)
+    parts, size, i = [head], head.count('\n'), 0
+    while size < lines:
+	method = methodTemplate.format(i=i)
+	parts.append(method)
+	size += method.count('\n')
+	i += 1
+    parts.append('}\n')
+    return ''.join(parts)
+
+
+def wrapMethod(name, body, params='int x'):
+    """ Returns the source of a class with one method of the given body lines. """
+    lines = ['public class {0} {{'.format(name)]
+    lines.append('    public int run({0}) {{'.format(params))
+    lines.extend('        ' + line for line in body)
+    lines.append('    }')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def arrayInitializer(name, n):
+    """ Returns a class with an array initializer of N items. """
+    items = [str(i) for i in range(n)]
+    rows = [', '.join(items[i:i+10]) for i in range(0, n, 10)]
+    body = ['int[] values = {'] + ['    ' + row + ',' for row in rows] + ['};']
+    body.append('return values.length + x;')
+    return wrapMethod(name, body)
+
+
+def comments(name, n):
+    """ Returns a class with N comments, between statements and in expressions. """
+    body = ['int total = x;']
+    for i in range(n):
+	if i % 3 == 0:
+	    body.append('// line comment {0}'.format(i))
+	elif i % 3 == 1:
+	    body.append('/* block comment {0} */'.format(i))
+	else:
+	    body.append('total = total + /* inline {0} */ {0};'.format(i))
+    body.append('return total;')
+    return wrapMethod(name, body)
+
+
+def nestedIfs(name, n):
+    """ Returns a class with if statements nested N deep, each with an else. """
+    body = ['int total = 0;']
+    for i in range(n):
+	body.append('    ' * i + 'if (x > {0}) {{'.format(i))
+	body.append('    ' * (i + 1) + 'total += {0};'.format(i))
+    for i in reversed(range(n)):
+	body.append('    ' * i + '} else {')
+	body.append('    ' * (i + 1) + 'total -= {0};'.format(i))
+	body.append('    ' * i + '}')
+    body.append('return total;')
+    return wrapMethod(name, body)
+
+
+def nestedTernaries(name, n):
+    """ Returns a class with a conditional expression nested N deep. """
+    parts = ['x > {0} ? {0} : '.format(i) for i in range(n)]
+    body = ['int y = ' + ''.join(parts) + '-1;', 'return y;']
+    return wrapMethod(name, body)
+
+
+def operatorChain(name, n):
+    """ Returns a class with a chain of N binary operations. """
+    ops = ['+', '*', '-', '/', '%', '&', '|', '^']
+    terms = ['x {0} {1}'.format(ops[i % len(ops)], i + 1) for i in range(n)]
+    rows = [' + '.join(terms[i:i+8]) for i in range(0, n, 8)]
+    body = ['int y = ' + ' +\n            '.join(rows) + ';', 'return y;']
+    return wrapMethod(name, body)
+
+
+def methods(name, n):
+    """ Returns a class of about N lines of ordinary methods. """
+    return largeClass(name, n)
+
+
+axes = {
+    'array' : arrayInitializer,
+    'comments' : comments,
+    'ifs' : nestedIfs,
+    'ternaries' : nestedTernaries,
+    'operators' : operatorChain,
+    'methods' : methods,
+}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] not in axes:
+	sys.exit('usage: javagen.py {{{0}}} N'.format(','.join(sorted(axes))))
+    sys.stdout.write(axes[sys.argv[1]]('Generated', int(sys.argv[2])))
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" scaling -> growth of translation time and memory with input size.
+
+This script translates the sources made by the `javagen.axes`
+generators at increasing sizes N, and fits the time of each phase and
+the memory growth against N on a log-log scale.  The slope of the fit
+is the growth exponent:  about 1 for linear work, about 2 for
+quadratic work.  The exit status is non-zero when an exponent is over
+the given bound:
+
+    $ python scaling.py
+    $ python scaling.py -a ifs -a ternaries -s 25,50,100,200 -e 1.5
+
+Besides the phases of `bench.py`, the time to write the debug dump of
+the AST ('dump') is measured.  Phases that take less than the minimum
+time at the largest size are reported but not checked, because their
+times are mostly noise.
+"""
+import sys
+from json import dump
+from math import log
+from multiprocessing import Pool
+from optparse import OptionParser
+
+import bench
+import javagen
+
+
+defaultSizes = {
+    'array' : (500, 1000, 2000, 4000),
+    'comments' : (250, 500, 1000, 2000),
+    'ifs' : (10, 20, 40, 80),
+    'ternaries' : (10, 20, 40, 80),
+    'operators' : (250, 500, 1000, 2000),
+    'methods' : (500, 1000, 2000, 4000),
+}
+
+phases = bench.phases + ('dump', )
+
+## the generated parser recurses through several rules for each nested
+## statement, so deeply nested ifs need more than the default limit.
+## The other axes run with the limit of the interpreter, so that a
+## recursion in the translator shows as an error.
+axisRecursionLimits = {
+    'ifs' : 20000,
+}
+
+
+def growthExponent(sizes, values):
+    """ Returns the slope of the least squares fit of log(value) to log(size). """
+    xs = [log(size) for size in sizes]
+    ys = [log(max(value, 1e-9)) for value in values]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    den = sum((x - mx) ** 2 for x in xs)
+    return num / den if den else 0.0
+
+
+def runOne(spec):
+    """ Translates one generated source in the current process. """
+    axis, size, recursionLimit = spec
+    if recursionLimit:
+	sys.setrecursionlimit(recursionLimit)
+    startKB = bench.peakKB()
+    source = javagen.axes[axis]('Generated', size)
+    result = dict(size=size, lines=len(source.splitlines()))
+    try:
+	marks = bench.translatePhases(source, 'Generated', dump=True)
+    except (Exception, ), exc:
+	result['error'] = '{0}: {1}'.format(type(exc).__name__, exc)
+	return result
+    result['seconds'] = dict((phase, marks[phase]['seconds']) for phase in phases)
+    result['growthKB'] = max(0, max(m['peakKB'] for m in marks.values()) - startKB)
+    return result
+
+
+def runAxis(pool, axis, sizes, options):
+    """ Runs and fits the given axis; returns its results. """
+    points = []
+    for size in sizes:
+	spec = (axis, size, options.recursionlimit or axisRecursionLimits.get(axis))
+	runs = [pool.apply(runOne, (spec, )) for i in range(options.repeat)]
+	errors = [run['error'] for run in runs if 'error' in run]
+	if errors:
+	    return dict(axis=axis, points=points, error='N={0}: {1}'.format(size, errors[0]))
+	seconds = dict((phase, min(run['seconds'][phase] for run in runs)) for phase in phases)
+	seconds['total'] = sum(seconds.values())
+	growth = max(run['growthKB'] for run in runs)
+	points.append(dict(size=size, lines=runs[0]['lines'], seconds=seconds, growthKB=growth))
+    sizes = [p['size'] for p in points]
+    exponents = dict((phase, growthExponent(sizes, [p['seconds'][phase] for p in points]))
+		     for phase in phases + ('total', ))
+    memory = growthExponent(sizes, [max(p['growthKB'], 1) for p in points])
+    return dict(axis=axis, points=points, exponents=exponents, memoryExponent=memory)
+
+
+def checkAxis(result, options):
+    """ Returns the lines describing the exponents of an axis that are over the bounds. """
+    if 'error' in result:
+	return ['{0}: {1}'.format(result['axis'], result['error'])]
+    lines, last = [], result['points'][-1]
+    minSeconds = options.mintime / 1000.0
+    for phase in phases + ('total', ):
+	exponent = result['exponents'][phase]
+	if last['seconds'][phase] >= minSeconds and exponent > options.maxexponent:
+	    lines.append('{0} {1}: time grows as N^{2:.2f} (bound {3:.2f})'.format(
+		result['axis'], phase, exponent, options.maxexponent))
+    exponent = result['memoryExponent']
+    if last['growthKB'] >= options.minmemory and exponent > options.maxmemoryexponent:
+	lines.append('{0}: memory grows as N^{1:.2f} (bound {2:.2f})'.format(
+	    result['axis'], exponent, options.maxmemoryexponent))
+    return lines
+
+
+def formatAxis(result):
+    """ Returns the lines of a table of the results of an axis. """
+    lines = ['{0}:'.format(result['axis'])]
+    fs = '  {0:>8} {1:>8} {2:>10} {3:>10}'
+    lines.append(fs.format('N', 'lines', 'seconds', 'growth MB'))
+    for p in result['points']:
+	lines.append(fs.format(p['size'], p['lines'], '{0:.4f}'.format(p['seconds']['total']),
+			       '{0:.1f}'.format(p['growthKB'] / 1024.0)))
+    if 'error' in result:
+	lines.append('  error: {0}'.format(result['error']))
+    else:
+	exps = result['exponents']
+	parts = ['{0} {1:.2f}'.format(phase, exps[phase]) for phase in phases + ('total', )]
+	lines.append('  time exponents: ' + ', '.join(parts))
+	lines.append('  memory exponent: {0:.2f}'.format(result['memoryExponent']))
+    return lines
+
+
+def main(options):
+    """ Runs the scaling tests of the selected axes; returns the exit status. """
+    bench.translationConfig = bench.Config(['java2python.config.default'] + options.configs)
+    bench.tokens.map # load the parser before the processes fork
+    pool = Pool(processes=1, maxtasksperchild=1)
+    try:
+	results = []
+	for axis in options.axes:
+	    sizes = options.sizes or defaultSizes[axis]
+	    results.append(runAxis(pool, axis, sizes, options))
+	    if not options.quiet:
+		print '\n'.join(formatAxis(results[-1]))
+	pool.close()
+    except:
+	pool.terminate()
+	raise
+    pool.join()
+    if options.output:
+	with open(options.output, 'w') as fh:
+	    dump(results, fh, indent=1, sort_keys=True)
+    failures = [line for result in results for line in checkAxis(result, options)]
+    if failures:
+	print '\nScaling failures:'
+	print '\n'.join(failures)
+	return 2
+    return 0
+
+
+def config(argv):
+    """ Returns an options object from the given argument sequence. """
+    parser = OptionParser(usage='%prog [options]')
+    addopt = parser.add_option
+    addopt('-a', '--axis', dest='axes',
+	   help='Test AXIS, one of {0}.  May be repeated.'.format(', '.join(sorted(javagen.axes))),
+	   metavar='AXIS', default=[], action='append', choices=sorted(javagen.axes),
+	   type='choice')
+    addopt('-s', '--sizes', dest='sizes',
+	   help='Use the comma separated SIZES for each axis.',
+	   metavar='SIZES', default=None)
+    addopt('-e', '--max-exponent', dest='maxexponent',
+	   help='Fail when the time of a phase grows faster than N^EXP.',
+	   metavar='EXP', default=1.3, type='float')
+    addopt('-M', '--max-memory-exponent', dest='maxmemoryexponent',
+	   help='Fail when the memory grows faster than N^EXP.',
+	   metavar='EXP', default=1.3, type='float')
+    addopt('-c', '--config', dest='configs',
+	   help='Use CONFIG file or module with the defaults.  May be repeated.',
+	   metavar='CONFIG', default=[], action='append')
+    addopt('-r', '--repeat', dest='repeat',
+	   help='Run each size N times and keep the best times.',
+	   metavar='N', default=3, type='int')
+    addopt('--min-time', dest='mintime',
+	   help='Do not check phases faster than MS milliseconds at the largest size.',
+	   metavar='MS', default=10.0, type='float')
+    addopt('--min-memory', dest='minmemory',
+	   help='Do not check memory growing less than KB kilobytes at the largest size.',
+	   metavar='KB', default=4096, type='int')
+    addopt('--recursion-limit', dest='recursionlimit',
+	   help='Set the recursion limit of the translating processes.  The default '
+		'is the limit of the interpreter, except for the ifs axis, where the '
+		'parser recurses through several rules for each nested statement.',
+	   metavar='N', default=None, type='int')
+    addopt('-o', '--output', dest='output',
+	   help='Write the results as JSON to FILE.',
+	   metavar='FILE', default=None)
+    addopt('-q', '--quiet', dest='quiet',
+	   help='Do not print the results of each axis.',
+	   default=False, action='store_true')
+    options, args = parser.parse_args(argv[1:])
+    if args:
+	parser.error('unexpected arguments: {0}'.format(' '.join(args)))
+    if options.sizes:
+	try:
+	    options.sizes = sorted(int(size) for size in options.sizes.split(','))
+	except (ValueError, ):
+	    parser.error('invalid sizes: {0}'.format(options.sizes))
+	if len(options.sizes) < 2:
+	    parser.error('at least two sizes are needed.')
+    options.axes = options.axes or sorted(javagen.axes)
+    return options
+
+
+if __name__ == '__main__':
+    sys.exit(main(config(sys.argv)))
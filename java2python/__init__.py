@@ -4,3 +4,6 @@
 ##
 # Top-level package marker for java2python.
 #
+
+
+version = '0.5'
@@ -6,14 +6,34 @@
 # subpackage.  Client code should use the values in this module
 # instead of using directly referencing items within the subpackage.
 
+from logging import Handler, WARNING, getLogger
+from os import path
+from time import time
+
 from java2python.compiler.block import Module
+from java2python.config import Config
 from java2python.lang import Lexer, Parser, StringStream, TokenStream, TreeAdaptor
+from java2python.lib import checkSyntax, instrument
+from java2python.mod import basic
+
+
+## recognition errors are logged here instead of written to stderr, so
+## that they are kept with the other warnings of a translation.
+recognitionError = getLogger(__name__).warning
+
 
+def reportErrors(*recognizers):
+    """ Sends the error messages of the given lexers and parsers to the log. """
+    for recognizer in recognizers:
+	recognizer.emitErrorMessage = recognitionError
 
-def buildAST(source):
-    """ Returns an AST for the given source. """
-    lexer = Lexer(StringStream(source))
+
+def buildAST(source, lexerClass=Lexer):
+    """ Returns an AST for the given source, tokenized by the given lexer class. """
+    lexer = lexerClass(StringStream(source))
+    reportErrors(lexer)
     parser = Parser(TokenStream(lexer))
+    reportErrors(parser)
     adapter = TreeAdaptor(lexer, parser)
     parser.setTreeAdaptor(adapter)
     scope = parser.javaSource()
@@ -25,13 +45,149 @@ def buildJavaDocAST(source):
     from java2python.lang.JavaDocLexer import JavaDocLexer
     from java2python.lang.JavaDocParser import JavaDocParser
     lexer = JavaDocLexer(StringStream(source))
+    reportErrors(lexer)
     parser = JavaDocParser(TokenStream(lexer))
+    reportErrors(parser)
     scope = parser.commentBody()
     return scope.tree
 
 
+def transformTable(transforms):
+    """ Groups transforms by the token types their selectors match at.
+
+    Returns a mapping of token type to transforms and the list of
+    transforms for other types.  Each list keeps the given order.
+    """
+    types, table = [(s.nodeTypes(), (s, c)) for s, c in transforms], {}
+    for keys, transform in types:
+	for key in keys or ():
+	    table[key] = [t for k, t in types if k is None or key in k]
+    return table, [t for k, t in types if k is None]
+
+
 def transformAST(tree, config):
-    """ Walk the tree and apply the transforms in the config. """
-    for selector, call in config.last('astTransforms', ()):
-        for node in selector.walk(tree):
-	    call(node, config)
+    """ Walk the tree once and apply the transforms in the config.
+
+    Each node is visited once, in depth-first order, and each transform
+    whose selector can match at the node is applied there in config
+    order.  When a transform runs, the node and the nodes after it have
+    only been changed by the transforms before it in the list, while
+    the nodes before it (including its ancestors and preceding
+    siblings) have been changed by all of them.
+    """
+    table, others = transformTable(config.last('astTransforms', ()))
+    if instrument.recorder:
+	table, others = instrument.recorder.timedTransforms(table, others)
+    stack = [tree]
+    while stack:
+	node = stack.pop()
+	for selector, call in table.get(node.type, others):
+	    for match in selector(node):
+		call(match, config)
+	stack.extend(reversed(node.children))
+
+
+class WarningCollector(Handler):
+    """ WarningCollector -> keeps the messages of warning log records.
+
+    Translations attach it to the `java2python` logger, so only the
+    records of that hierarchy are kept, and the root logger and its
+    handlers are left alone.
+    """
+    loggerName = 'java2python'
+
+    def __init__(self):
+	Handler.__init__(self, WARNING)
+	self.messages = []
+
+    def emit(self, record):
+	self.messages.append(record.getMessage())
+
+
+class Translation(object):
+    """ Translation -> the result of translating one source.
+
+    The `output` attribute is the generated Python source, `warnings`
+    is the list of warning messages logged by java2python while
+    translating (including lexer and parser errors), and `valid` is
+    true if the output compiles.  The `timings` mapping has the
+    seconds spent in each of the 'parse', 'transform', 'visit' and
+    'encode' phases, and in 'total'.  The `tree` and `module`
+    attributes are the Java AST and the Python template tree.
+    """
+
+    def __init__(self, name):
+	self.name, self.output, self.warnings = name, None, []
+	self.valid, self.syntaxError, self.timings = None, None, {}
+	self.tree = self.module = None
+
+
+class Translator(object):
+    """ Translator -> translates Java sources with one configuration.
+
+    Build one instance from a list of config module names (or from a
+    Config instance) and call `translate` for each source:
+
+	translator = Translator(['java2python.config.default'])
+	result = translator.translate(source, 'Foo')
+	print result.output
+
+    The configuration is loaded once and shared by every translation.
+    Set `validate` to false to skip compiling the output.  Pass
+    `java2python.lang.FastLexer` as the lexer class to tokenize sources
+    with regular expressions instead of the generated lexer.
+    """
+    validate = True
+
+    def __init__(self, configs, lexerClass=Lexer):
+	self.config = configs if isinstance(configs, Config) else Config(configs)
+	self.lexerClass = lexerClass
+
+    def translate(self, source, name=None, filename=None):
+	""" Translates the given source and returns a Translation.
+
+	The module name is taken from the file name (if any) when not
+	given.  Exceptions raised while parsing or translating are not
+	caught.
+	"""
+	if name is None:
+	    name = path.splitext(path.basename(filename))[0] if filename else '<stdin>'
+	result, timings, config = Translation(name), {}, self.config
+	collector = WarningCollector()
+	getLogger(collector.loggerName).addHandler(collector)
+	try:
+	    basic.resetNameCounter()
+	    start = time()
+	    tree = result.tree = buildAST(source, self.lexerClass)
+	    mark = self.timePhase(timings, 'parse', start)
+
+	    transformAST(tree, config)
+	    mark = self.timePhase(timings, 'transform', mark)
+
+	    module = result.module = Module(config)
+	    module.sourceFilename = path.abspath(filename) if filename else None
+	    module.name = name
+	    module.walk(tree)
+	    mark = self.timePhase(timings, 'visit', mark)
+
+	    result.output = unicode(module)
+	    self.timePhase(timings, 'encode', mark)
+	    self.timePhase(timings, 'total', start)
+	finally:
+	    getLogger(collector.loggerName).removeHandler(collector)
+	result.timings, result.warnings = timings, collector.messages
+	if self.validate:
+	    result.syntaxError = checkSyntax(result.output)
+	    result.valid = result.syntaxError is None
+	return result
+
+    def timePhase(self, timings, phase, started):
+	""" Records the seconds since `started` as the time of a phase.
+
+	Returns the current time, which is the start of the next phase.
+	Subclasses can extend this to record more about each phase.
+	"""
+	now = time()
+	timings[phase] = now - started
+	return now
+
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.compiler.batch -> translate many source files at once. """
+##
+# This module provides the multi-file mode of the j2py script.  Input
+# names (files, directories, and glob patterns) are expanded into
+# jobs, and the jobs are translated in a pool of worker processes.
+#
+# Each worker imports the lexer, parser and config modules once and
+# keeps its `Config` instances between files, so the per-file cost is
+# only the translation itself.  Results are collected in input order
+# and failures are reported per file; a bad input never aborts the
+# run.
+
+from glob import glob
+from itertools import imap, takewhile
+from multiprocessing import Pool
+from os import makedirs, path, walk
+from traceback import format_exc
+
+from java2python.compiler import Translator
+from java2python.compiler.cache import isCacheable, sourceKey
+from java2python.lang import Lexer, tokens
+
+
+sourceSuffix = '.java'
+
+
+class Job(object):
+    """ Job -> one input file, its output name, and its config names.
+
+    When `record` is true, the result of the job includes the record
+    made by `moduleRecord`, and the translation cache is not read.
+    The source is tokenized with `lexerClass`.
+    """
+
+    def __init__(self, filename, outname, configs, relname=None, record=False, lexerClass=Lexer):
+	self.filename, self.outname, self.configs = filename, outname, configs
+	self.relname = relname or filename
+	self.record, self.lexerClass = record, lexerClass
+
+
+class Result(object):
+    """ Result -> outcome of translating one job. """
+
+    def __init__(self, job, error=None, record=None):
+	self.job, self.error, self.record = job, error, record
+
+    @property
+    def ok(self):
+	""" True if the job was translated without error. """
+	return self.error is None
+
+
+def isPattern(name):
+    """ True if the given name contains glob characters. """
+    return any(c in name for c in '*?[')
+
+
+def iterSourceFiles(dirname):
+    """ Yields the java source files below a directory, sorted. """
+    for root, dirs, files in walk(dirname):
+	dirs.sort()
+	for name in sorted(files):
+	    if name.endswith(sourceSuffix):
+		yield path.join(root, name)
+
+
+class DuplicateOutputError(Exception):
+    """ DuplicateOutputError -> raised when two inputs map to one output file. """
+
+
+def isOutside(filename):
+    """ True if the file name is absolute or outside the current directory. """
+    name = path.normpath(filename)
+    return path.isabs(name) or name == path.pardir or name.startswith(path.pardir + path.sep)
+
+
+def commonDirectory(filenames):
+    """ Returns the deepest directory that contains all of the given files. """
+    common = None
+    for filename in filenames:
+	parts = path.dirname(path.abspath(filename)).split(path.sep)
+	if common is None:
+	    common = parts
+	else:
+	    common = [a for a, b in takewhile(lambda pair:pair[0] == pair[1], zip(common, parts))]
+    return path.sep.join(common or ()) or path.sep
+
+
+def iterSources(names):
+    """ Yields (filename, relative name) pairs for the given inputs.
+
+    Directories are searched for java sources and the relative name is
+    taken from the directory root.  Plain files and glob matches below
+    the current directory are named relative to it; the others are
+    named relative to the deepest directory that contains all of them,
+    so files with the same name in different directories keep apart.
+    Duplicates are dropped.
+    """
+    seen, pairs = set(), []
+    for name in names:
+	if path.isdir(name):
+	    found = ((f, path.relpath(f, name)) for f in iterSourceFiles(name))
+	elif isPattern(name):
+	    found = ((f, None) for f in sorted(glob(name)) if path.isfile(f))
+	else:
+	    found = [(name, None)]
+	for filename, relname in found:
+	    key = path.abspath(filename)
+	    if key not in seen:
+		seen.add(key)
+		pairs.append((filename, relname))
+    outside = [f for f, r in pairs if r is None and isOutside(f)]
+    base = commonDirectory(outside) if outside else None
+    for filename, relname in pairs:
+	if relname is None:
+	    if isOutside(filename):
+		relname = path.relpath(path.abspath(filename), base)
+	    else:
+		relname = path.normpath(filename)
+	yield filename, relname
+
+
+def readFileList(filename):
+    """ Returns the input names listed in a file, one per line. """
+    with open(filename) as fh:
+	lines = [line.strip() for line in fh]
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def outputName(filename, relname, outdir=None):
+    """ Returns the output file name for the given input. """
+    if outdir is None:
+	return '%s.py' % path.splitext(filename)[0]
+    return path.join(outdir, '%s.py' % path.splitext(relname)[0])
+
+
+def makeJobs(names, configNames, outdir=None, lexerClass=Lexer):
+    """ Returns a list of jobs for the given input names.
+
+    The `configNames` argument is a callable that accepts an input
+    file name and returns the list of config names to use for it.
+    Raises DuplicateOutputError if two inputs have the same output
+    file name.
+    """
+    jobs, outputs = [], {}
+    for filename, relname in iterSources(names):
+	outname = outputName(filename, relname, outdir)
+	other = outputs.setdefault(path.abspath(outname), filename)
+	if other != filename:
+	    raise DuplicateOutputError('%s and %s would both be written to %s' % (other, filename, outname))
+	jobs.append(Job(filename, outname, configNames(filename), relname, lexerClass=lexerClass))
+    return jobs
+
+
+## each worker process keeps one Translator per distinct list of names and lexer.
+translators = {}
+
+
+def cachedTranslator(names, lexerClass=Lexer):
+    """ Returns a Translator for the given names, creating it once per process. """
+    key = (tuple(names), lexerClass)
+    try:
+	return translators[key]
+    except (KeyError, ):
+	translator = translators[key] = Translator(names, lexerClass)
+	translator.validate = False
+	return translator
+
+
+## the translation cache used by runJob in this process, if any.
+jobCache = None
+
+
+def setJobCache(cache):
+    """ Sets the translation cache used by runJob in this process. """
+    global jobCache
+    jobCache = cache
+
+
+def moduleName(filename):
+    """ Returns the module name for the given source file name. """
+    return path.splitext(path.basename(filename))[0]
+
+
+def moduleRecord(module):
+    """ Returns the package, imports and declared types of a walked module. """
+    return dict(
+	package=module.packageName,
+	imports=list(module.importNames),
+	types=module.declaredTypeNames,
+    )
+
+
+def runJob(job):
+    """ Translates one job and writes its output; returns a Result. """
+    try:
+	with open(job.filename) as fh:
+	    source = fh.read()
+	translator = cachedTranslator(job.configs, job.lexerClass)
+	output = key = record = None
+	if jobCache and isCacheable(translator.config):
+	    key = sourceKey(source, translator.config, moduleName(job.filename))
+	    if not job.record:
+		output = jobCache.get(key)
+	if output is None:
+	    translation = translator.translate(source, filename=job.filename)
+	    output = translation.output
+	    if job.record:
+		record = moduleRecord(translation.module)
+	    if key:
+		jobCache.put(key, output)
+	dirname = path.dirname(job.outname)
+	if dirname and not path.isdir(dirname):
+	    try:
+		makedirs(dirname)
+	    except (OSError, ):
+		## another worker may have created it first
+		if not path.isdir(dirname):
+		    raise
+	with open(job.outname, 'w') as fh:
+	    print >> fh, output
+    except (Exception, ):
+	return Result(job, format_exc())
+    return Result(job, record=record)
+
+
+def runJobs(jobs, workers=1, cache=None):
+    """ Yields a Result for each job, in job order.
+
+    When `workers` is greater than one, the jobs are translated in a
+    pool of that many processes.  The output does not depend on the
+    number of workers.  If given, `cache` is a `TranslationCache`
+    shared by all of the workers.
+    """
+    tokens.map # warm the token map before forking
+    if workers < 2 or len(jobs) < 2:
+	setJobCache(cache)
+	return imap(runJob, jobs)
+    return iterPool(jobs, workers, cache)
+
+
+def iterPool(jobs, workers, cache):
+    """ Yields results from a process pool, closing the pool when done. """
+    pool = Pool(processes=workers, initializer=setJobCache, initargs=(cache, ))
+    try:
+	chunk = max(1, min(16, len(jobs) // (workers * 4)))
+	for result in pool.imap(runJob, jobs, chunk):
+	    yield result
+	pool.close()
+    except:
+	pool.terminate()
+	raise
+    finally:
+	pool.join()
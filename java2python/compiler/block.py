@@ -19,7 +19,7 @@ from java2python.compiler import template, visitor
 def newType(className, factoryTypeName):
     """ Creates a class derived from template.className and visitor.className """
     bases = (getattr(template, className), getattr(visitor, className))
-    return type(className, bases, dict(factoryTypeName=factoryTypeName))
+    return type(className, bases, dict(factoryTypeName=factoryTypeName, __slots__=()))
 
 
 def addTypeToModule((cn, ftn)):
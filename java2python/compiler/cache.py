@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.compiler.cache -> persistent cache of translated sources. """
+##
+# This module provides a content-addressed, on-disk cache of
+# translation output.  Entries are keyed by a hash of the Java source,
+# the sources of the java2python package, the source of each config
+# module in use and of the modules it refers to, and the java2python
+# version.  A hit means the source does not need to be parsed,
+# transformed or visited at all.  Configs with handlers that do more
+# than produce the output are not cached; see `isCacheable`.
+#
+# Entries are plain files stored in a two-level directory layout.
+# They are written to a temporary file and renamed into place, so
+# readers never see a partial entry and several j2py processes can
+# share one cache directory.  The modification time of an entry is
+# updated on each hit.  The total size of the entries is kept in a
+# marker file that each put updates while holding the lock, so the
+# limit holds across processes, including those that make one put
+# each.  When a put takes the total past the limit, the least recently
+# used entries are removed and the total is counted again.
+
+from hashlib import sha1
+from logging import debug
+from os import fdopen, getpid, listdir, makedirs, path, remove, rename, stat, utime, walk
+from sys import modules
+from tempfile import mkstemp
+from types import ModuleType
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+except (ImportError, ):
+    flock = None
+
+import java2python
+from java2python import version
+from java2python.lib import defaultCacheDir
+
+
+def moduleSourceName(module):
+    """ Returns the source file name of a module, if any. """
+    name = getattr(module, '__file__', None)
+    if name and name.endswith(('.pyc', '.pyo')) and path.exists(name[:-1]):
+	name = name[:-1]
+    return name
+
+
+## the digest of the java2python package sources, once computed.
+packageDigestValue = None
+
+
+def packageDigest():
+    """ Returns a digest of the sources of the java2python package.
+
+    The digest is computed once per process.
+    """
+    global packageDigestValue
+    if packageDigestValue is None:
+	digest, root = sha1(), path.dirname(path.abspath(java2python.__file__))
+	for dirname, dirs, files in walk(root):
+	    dirs.sort()
+	    for name in sorted(files):
+		if name.endswith('.py'):
+		    name = path.join(dirname, name)
+		    digest.update(path.relpath(name, root) + '\0')
+		    with open(name, 'rb') as fh:
+			digest.update(fh.read())
+	packageDigestValue = digest.hexdigest()
+    return packageDigestValue
+
+
+def isPackageModule(module):
+    """ True if the module is part of the java2python package. """
+    return module.__name__ == 'java2python' or module.__name__.startswith('java2python.')
+
+
+def referencedModules(config):
+    """ Returns the modules the config modules refer to, outside java2python.
+
+    These are the modules bound to names in a config module, and the
+    modules that define the functions and classes bound there or
+    listed in its handler sequences.
+    """
+    found = {}
+    def add(value):
+	if isinstance(value, ModuleType):
+	    module = value
+	else:
+	    value = getattr(value, 'func', value) # partials
+	    module = modules.get(getattr(value, '__module__', None) or '')
+	if module is not None and not isPackageModule(module):
+	    found[module.__name__] = module
+    for mod in config.configs:
+	for value in vars(mod).values():
+	    add(value)
+	    if isinstance(value, (list, tuple)):
+		for item in value:
+		    add(item)
+    for mod in config.configs:
+	found.pop(mod.__name__, None)
+    return [found[name] for name in sorted(found)]
+
+
+def configDigest(config):
+    """ Returns a digest of the code used by the given config.
+
+    The digest covers the java2python package, the config modules and
+    the modules they refer to (see `referencedModules`).  It is
+    computed once per config instance and kept in `config.derived`.
+    """
+    try:
+	return config.derived['configDigest']
+    except (KeyError, ):
+	pass
+    digest = sha1(packageDigest() + '\0')
+    for module in config.configs + referencedModules(config):
+	digest.update(module.__name__ + '\0')
+	name = moduleSourceName(module)
+	if name:
+	    with open(name, 'rb') as fh:
+		digest.update(fh.read())
+	digest.update('\0')
+    value = config.derived['configDigest'] = digest.hexdigest()
+    return value
+
+
+def hasSideEffects(value):
+    """ True if the config value is, or lists, a handler with side effects. """
+    if isinstance(value, (list, tuple)):
+	return any(hasSideEffects(item) for item in value)
+    return getattr(getattr(value, 'func', value), 'hasSideEffects', False) is True
+
+
+def isCacheable(config):
+    """ True if translations made with the config may be cached.
+
+    Handlers marked with a true `hasSideEffects` attribute do more than
+    produce the output (`basic.namespacePackages` writes `__init__.py`
+    files, for example), and would not run for a cached result, so
+    configs that use them are not cached.
+    """
+    try:
+	return config.derived['cacheable']
+    except (KeyError, ):
+	pass
+    values = config.everyValues.values()
+    value = config.derived['cacheable'] = not any(hasSideEffects(v) for vs in values for v in vs)
+    return value
+
+
+def sourceKey(source, config, name):
+    """ Returns the cache key for the given source, config and module name. """
+    if isinstance(source, unicode):
+	source = source.encode('utf-8')
+    if isinstance(name, unicode):
+	name = name.encode('utf-8')
+    digest = sha1(version + '\0')
+    digest.update(configDigest(config) + '\0')
+    digest.update(name + '\0')
+    digest.update(source)
+    return digest.hexdigest()
+
+
+class TranslationCache(object):
+    """ TranslationCache -> size-limited LRU cache of translation output.
+
+    Use `get` and `put` with keys made by `sourceKey`.  The size limit
+    is checked on every put.
+    """
+    entrySuffix = '.py'
+    lockName = '.lock'
+    sizeName = '.size'
+
+    def __init__(self, dirname, maxBytes=256 * 1024 * 1024):
+	self.dirname, self.maxBytes, self.puts = dirname, maxBytes, 0
+	self.hits = self.misses = 0
+
+    def entryName(self, key):
+	""" Returns the file name of the entry for the given key. """
+	return path.join(self.dirname, key[:2], key[2:] + self.entrySuffix)
+
+    def get(self, key):
+	""" Returns the cached text for the given key, or None. """
+	name = self.entryName(key)
+	try:
+	    with open(name, 'rb') as fh:
+		text = fh.read()
+	    utime(name, None)
+	except (IOError, OSError, ):
+	    self.misses += 1
+	    return None
+	self.hits += 1
+	return text.decode('utf-8')
+
+    def put(self, key, text):
+	""" Stores the given text under the given key. """
+	if isinstance(text, unicode):
+	    text = text.encode('utf-8')
+	name = self.entryName(key)
+	dirname = path.dirname(name)
+	try:
+	    if not path.isdir(dirname):
+		try:
+		    makedirs(dirname)
+		except (OSError, ):
+		    if not path.isdir(dirname):
+			raise
+	    fd, tmpname = mkstemp(prefix='.%s.' % getpid(), dir=dirname)
+	except (IOError, OSError, ), exc:
+	    debug('cache write failed: %s', exc)
+	    return
+	try:
+	    previous = stat(name).st_size
+	except (OSError, ):
+	    previous = 0
+	try:
+	    with fdopen(fd, 'wb') as fh:
+		fh.write(text)
+	    rename(tmpname, name)
+	except (IOError, OSError, ), exc:
+	    debug('cache write failed: %s', exc)
+	    try:
+		remove(tmpname)
+	    except (OSError, ):
+		pass
+	    return
+	self.puts += 1
+	self.grow(len(text) - previous)
+
+    def entries(self):
+	""" Returns a list of (mtime, size, name) for each entry. """
+	items = []
+	for sub in listdir(self.dirname):
+	    subdir = path.join(self.dirname, sub)
+	    if len(sub) != 2 or not path.isdir(subdir):
+		continue
+	    for name in listdir(subdir):
+		if not name.endswith(self.entrySuffix) or name.startswith('.'):
+		    continue
+		name = path.join(subdir, name)
+		try:
+		    info = stat(name)
+		except (OSError, ):
+		    continue
+		items.append((info.st_mtime, info.st_size, name))
+	return items
+
+    def lock(self):
+	""" Returns the open lock file of the cache, locked by this process. """
+	lockfile = open(path.join(self.dirname, self.lockName), 'a')
+	if flock:
+	    flock(lockfile, LOCK_EX)
+	return lockfile
+
+    def unlock(self, lockfile):
+	""" Unlocks and closes a lock file returned by `lock`. """
+	if flock:
+	    flock(lockfile, LOCK_UN)
+	lockfile.close()
+
+    def readSize(self):
+	""" Returns the total size in the size marker, or None if there is none. """
+	try:
+	    with open(path.join(self.dirname, self.sizeName)) as fh:
+		return int(fh.read())
+	except (IOError, ValueError, ):
+	    return None
+
+    def writeSize(self, total):
+	""" Writes the given total size to the size marker. """
+	try:
+	    with open(path.join(self.dirname, self.sizeName), 'w') as fh:
+		fh.write(str(total))
+	except (IOError, ), exc:
+	    debug('cache size write failed: %s', exc)
+
+    def grow(self, delta):
+	""" Adds delta bytes to the total size and evicts if it is over the limit.
+
+	Without a size marker (a new cache, or one made by an older
+	version), the total is counted from the entries.  Must be called
+	after the entry is written.
+	"""
+	try:
+	    lockfile = self.lock()
+	except (IOError, ), exc:
+	    debug('cache lock failed: %s', exc)
+	    return
+	try:
+	    total = self.readSize()
+	    if total is None:
+		total = sum(size for mtime, size, name in self.entries())
+	    else:
+		total += delta
+	    if total > self.maxBytes:
+		total = self.removeOldest()
+	    self.writeSize(total)
+	finally:
+	    self.unlock(lockfile)
+
+    def evict(self):
+	""" Removes least recently used entries until the cache fits. """
+	if not path.isdir(self.dirname):
+	    return
+	lockfile = self.lock()
+	try:
+	    self.writeSize(self.removeOldest())
+	finally:
+	    self.unlock(lockfile)
+
+    def removeOldest(self):
+	""" Removes least recently used entries until the cache fits; returns its size.
+
+	The caller holds the lock.
+	"""
+	items = sorted(self.entries())
+	total = sum(size for mtime, size, name in items)
+	for mtime, size, name in items:
+	    if total <= self.maxBytes:
+		break
+	    try:
+		remove(name)
+	    except (OSError, ):
+		pass
+	    total -= size
+	return total
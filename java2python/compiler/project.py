@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.compiler.project -> incremental translation of source trees. """
+##
+# This module provides the project mode of the j2py script.  A
+# project is a set of batch jobs plus a manifest that records, for
+# each translated file, its source digest, its config digest, its
+# package, the names it imports, and the types it declares.  The
+# package and import names are the same values the module visitor
+# hands to the package and import declaration handlers.
+#
+# On each run only these files are translated:
+#
+# * files that are new, or whose source, config or output changed
+# * files that depend on a changed, new or deleted file
+#
+# A file depends on another when they share a package, when it
+# imports the package of the other, or when it imports (or imports a
+# member of) a type the other declares.  The dependents are found
+# with the records made before and after the change, so moving a type
+# from one file to another is handled too.  Outputs of deleted sources
+# are removed.  Entries of sources that still exist but are not part
+# of the run are kept as they are, so a run over some of the inputs
+# leaves the outputs of the others alone.
+
+from hashlib import sha1
+from json import dump, load
+from logging import info, warning
+from os import path, remove, rename, stat
+from tempfile import NamedTemporaryFile
+
+from java2python.compiler.batch import cachedTranslator, runJobs
+from java2python.compiler.cache import configDigest
+
+
+manifestName = '.j2py-manifest.json'
+
+
+def fileDigest(filename):
+    """ Returns the hex digest of the content of the given file. """
+    with open(filename, 'rb') as fh:
+	return sha1(fh.read()).hexdigest()
+
+
+class Manifest(object):
+    """ Manifest -> per-file records of a translated project.
+
+    Entries are keyed by the relative name of the source, and each is a
+    dictionary with the keys `filename`, `output`, `mtime`, `size`,
+    `digest`, `config`, `package`, `imports` and `types`.
+    """
+    formatVersion = 1
+
+    def __init__(self, filename):
+	self.filename, self.entries = filename, {}
+	if path.exists(filename):
+	    try:
+		with open(filename) as fh:
+		    data = load(fh)
+	    except (IOError, ValueError, ), exc:
+		warning('ignoring unreadable manifest %s: %s', filename, exc)
+	    else:
+		if data.get('version') == self.formatVersion:
+		    self.entries = data.get('entries', {})
+
+    def save(self):
+	""" Writes this manifest; the previous one is replaced atomically. """
+	dirname = path.dirname(path.abspath(self.filename))
+	with NamedTemporaryFile('w', dir=dirname, delete=False) as fh:
+	    dump(dict(version=self.formatVersion, entries=self.entries), fh,
+		 indent=1, sort_keys=True)
+	rename(fh.name, self.filename)
+
+
+def jobConfigDigest(job):
+    """ Returns the config digest for the given job. """
+    return configDigest(cachedTranslator(job.configs, job.lexerClass).config)
+
+
+def isCurrent(entry, job, digest):
+    """ True if the manifest entry is current for the given job.
+
+    The source is hashed only when its size or mtime has changed.  The
+    entry is updated with the new stat values when the digest matches.
+    """
+    if entry is None or entry['config'] != digest:
+	return False
+    if entry['output'] != job.outname or not path.exists(job.outname):
+	return False
+    status = stat(job.filename)
+    if (entry['mtime'], entry['size']) == (status.st_mtime, status.st_size):
+	return True
+    if entry['digest'] == fileDigest(job.filename):
+	entry['mtime'], entry['size'] = status.st_mtime, status.st_size
+	return True
+    return False
+
+
+def entryKeys(entry):
+    """ Returns the package and qualified type names of an entry. """
+    package = entry['package'] or ''
+    prefix = package + '.' if package else ''
+    return package, set(prefix + name for name in entry['types'])
+
+
+class ChangeSet(object):
+    """ ChangeSet -> packages and types touched by changed files. """
+
+    def __init__(self):
+	self.packages, self.types = set(), set()
+
+    def add(self, entry):
+	""" Adds the package and types of the given manifest entry. """
+	if entry:
+	    package, types = entryKeys(entry)
+	    self.packages.add(package)
+	    self.types.update(types)
+
+    def affects(self, entry):
+	""" True if the file of the given entry depends on this change set. """
+	if (entry['package'] or '') in self.packages:
+	    return True
+	for name in entry['imports']:
+	    if name in self.packages or name in self.types:
+		return True
+	    parts = name.split('.')
+	    for index in range(1, len(parts)):
+		if '.'.join(parts[:index]) in self.types:
+		    return True
+	return False
+
+
+def makeEntry(job, result, digest, previous=None):
+    """ Returns a new manifest entry for a translated job. """
+    status = stat(job.filename)
+    record = result.record or previous or dict(package=None, imports=[], types=[])
+    return dict(
+	filename=path.abspath(job.filename),
+	output=job.outname,
+	mtime=status.st_mtime,
+	size=status.st_size,
+	digest=fileDigest(job.filename),
+	config=digest,
+	package=record['package'],
+	imports=record['imports'],
+	types=record['types'],
+    )
+
+
+def removeOutput(entry):
+    """ Removes the output file of a manifest entry, if it exists. """
+    try:
+	remove(entry['output'])
+    except (OSError, ):
+	pass
+    else:
+	info('removed %s', entry['output'])
+
+
+def runProject(jobs, manifest, workers=1, cache=None):
+    """ Yields a Result for each job that needs translating.
+
+    Jobs for changed files run first; jobs for files that depend on
+    them run second.  The manifest is updated as results arrive but
+    is not saved.
+    """
+    entries = manifest.entries
+    names = set(job.relname for job in jobs)
+    changes = ChangeSet()
+    for name in sorted(set(entries) - names):
+	entry = entries[name]
+	if not path.exists(entry['filename']):
+	    del entries[name]
+	    changes.add(entry)
+	    removeOutput(entry)
+
+    digests = dict((job.relname, jobConfigDigest(job)) for job in jobs)
+    changed, unchanged = [], []
+    for job in jobs:
+	if isCurrent(entries.get(job.relname), job, digests[job.relname]):
+	    unchanged.append(job)
+	else:
+	    job.record = True
+	    changed.append(job)
+
+    for result in runJobs(changed, workers, cache):
+	job = result.job
+	changes.add(entries.get(job.relname))
+	if result.ok:
+	    entries[job.relname] = entry = makeEntry(job, result, digests[job.relname])
+	    changes.add(entry)
+	else:
+	    entries.pop(job.relname, None)
+	yield result
+
+    dependents = [job for job in unchanged if changes.affects(entries[job.relname])]
+    for result in runJobs(dependents, workers, cache):
+	job = result.job
+	if result.ok:
+	    previous = entries[job.relname]
+	    entries[job.relname] = makeEntry(job, result, digests[job.relname], previous)
+	else:
+	    entries.pop(job.relname, None)
+	yield result
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.compiler.server -> translation daemon. """
+##
+# This module provides a long-lived translation server listening on a
+# local Unix domain socket.  The server keeps the parser, the token map
+# and the config modules loaded, so a request only pays for the
+# translation itself.  The client is `java2python.lib.client`; its
+# names are imported here as well.
+#
+# The protocol is line based.  Each request is one line of JSON with
+# the keys `source`, `configs`, and optionally `filename` and `name`.
+# Each response is one line of JSON with either an `output` or an
+# `error` key.  A client may send any number of requests on one
+# connection.
+#
+# Clients are served by separate threads.  Recent results are kept in
+# an in-memory LRU and are returned without taking the translation
+# lock; translations themselves are serialized because the compiler
+# keeps some global state (the name counter, for example).  Config
+# modules are reloaded when the modification time of their source
+# changes.
+
+from SocketServer import StreamRequestHandler, ThreadingMixIn, UnixStreamServer
+from collections import OrderedDict
+from imp import reload
+from json import dumps, loads
+from logging import debug, exception, info, warning
+from os import makedirs, path, remove, stat
+from socket import AF_UNIX, SOCK_STREAM, error as SocketError, socket
+from threading import Lock
+from traceback import format_exc
+
+from java2python.compiler import Translator
+from java2python.compiler.cache import isCacheable, moduleSourceName, sourceKey
+from java2python.config import Config
+from java2python.lang import Lexer, tokens
+from java2python.lib.client import ServerError, defaultSocketName, translateRemote
+
+
+def moduleTime(module):
+    """ Returns the modification time of the source of a module, or None. """
+    name = moduleSourceName(module)
+    try:
+	return stat(name).st_mtime if name else None
+    except (OSError, ):
+	return None
+
+
+class ConfigEntry(object):
+    """ ConfigEntry -> a loaded config and the times of its modules. """
+
+    def __init__(self, names, lexerClass=Lexer):
+	self.names, self.lexerClass = names, lexerClass
+	self.translator = self.makeTranslator()
+	self.times = self.moduleTimes()
+
+    @property
+    def config(self):
+	""" Returns the current config. """
+	return self.translator.config
+
+    def makeTranslator(self):
+	""" Returns a new translator for the names of this entry. """
+	translator = Translator(self.names, self.lexerClass)
+	translator.validate = False
+	return translator
+
+    def moduleTimes(self):
+	""" Returns the modification times of the config modules. """
+	return [moduleTime(module) for module in self.config.configs]
+
+    def refresh(self):
+	""" Reloads changed config modules; true if any were reloaded. """
+	times = self.moduleTimes()
+	if times == self.times:
+	    return False
+	for name, module, old, new in zip(self.names, self.config.configs, self.times, times):
+	    if old != new:
+		info('reloading config %s', name)
+		if path.exists(name):
+		    Config.load(name)
+		else:
+		    reload(module)
+	self.translator = self.makeTranslator()
+	self.times = self.moduleTimes()
+	return True
+
+
+class TranslationServer(ThreadingMixIn, UnixStreamServer):
+    """ TranslationServer -> serves translation requests on a Unix socket. """
+    daemon_threads = True
+
+    def __init__(self, address, cacheSize=256, lexerClass=Lexer):
+	UnixStreamServer.__init__(self, address, RequestHandler)
+	self.cacheSize, self.results = cacheSize, OrderedDict()
+	self.lexerClass = lexerClass
+	self.configs, self.lock = {}, Lock()
+	tokens.map # warm the token map
+
+    def translator(self, names):
+	""" Returns the current translator for the given config names. """
+	key = tuple(names)
+	try:
+	    entry = self.configs[key]
+	except (KeyError, ):
+	    entry = self.configs[key] = ConfigEntry(names, self.lexerClass)
+	else:
+	    entry.refresh()
+	return entry.translator
+
+    def cached(self, key):
+	""" Returns the cached result for the given key, or None. """
+	with self.lock:
+	    try:
+		value = self.results.pop(key)
+	    except (KeyError, ):
+		return None
+	    self.results[key] = value
+	    return value
+
+    def store(self, key, value):
+	""" Adds a result to the cache, evicting the oldest if full. """
+	self.results[key] = value
+	while len(self.results) > self.cacheSize:
+	    self.results.popitem(last=False)
+
+    def handle(self, request):
+	""" Returns the response for a decoded request. """
+	source, filename = request['source'], request.get('filename')
+	name = request.get('name') or '<stdin>'
+	with self.lock:
+	    translator = self.translator(request.get('configs', []))
+	    key = None
+	    if isCacheable(translator.config):
+		key = sourceKey(source, translator.config, name)
+	output = self.cached(key) if key else None
+	if output is None:
+	    with self.lock:
+		output = translator.translate(source, name, filename).output
+		if key:
+		    self.store(key, output)
+	else:
+	    debug('cached result for %s', name)
+	return dict(output=output)
+
+
+class RequestHandler(StreamRequestHandler):
+    """ RequestHandler -> reads requests from one client connection. """
+
+    def handle(self):
+	""" Answers each request line until the client disconnects. """
+	for line in iter(self.rfile.readline, ''):
+	    try:
+		response = self.server.handle(loads(line))
+	    except (Exception, ):
+		exception('request failed')
+		response = dict(error=format_exc())
+	    self.wfile.write(dumps(response) + '\n')
+	    self.wfile.flush()
+
+
+def isListening(address):
+    """ True if a server is accepting connections at the given address. """
+    sock = socket(AF_UNIX, SOCK_STREAM)
+    try:
+	sock.connect(address)
+    except (SocketError, ):
+	return False
+    finally:
+	sock.close()
+    return True
+
+
+def serve(address=None, cacheSize=256, lexerClass=Lexer):
+    """ Runs a translation server at the given address until interrupted. """
+    address = address or defaultSocketName()
+    dirname = path.dirname(address)
+    if dirname and not path.isdir(dirname):
+	makedirs(dirname)
+    if path.exists(address):
+	if isListening(address):
+	    raise ServerError('a server is already listening at %s' % address)
+	remove(address)
+    server = TranslationServer(address, cacheSize, lexerClass)
+    info('serving on %s', address)
+    try:
+	server.serve_forever()
+    except (KeyboardInterrupt, ):
+	pass
+    finally:
+	server.server_close()
+	remove(address)
@@ -13,13 +13,30 @@
 # the compiler subpackage into multiple modules.  So-called patterns
 # are usually a sign of a bad design and/or language limitations, and
 # this case is no exception.
+#
+# Templates are written without recursion:  `Base.dump` keeps the
+# nested templates on an explicit stack, and `Expression.__str__`
+# renders nested expressions from a stack of fragments.  The output
+# of both goes into one list of strings that is joined at the end.
+#
+# Large sources create a great many templates, most of them small
+# expressions.  To keep them compact, the templates use slots for
+# their common attributes, create their lists only when first used,
+# and share one factory per config.  Other attributes can still be
+# set on them; those are kept in an instance dictionary that is only
+# created when needed.
+#
+# Each template also keeps references to its enclosing class and
+# method, and a set of the names declared in it (its variables and
+# parameters).  These are filled in as the declarations are accepted,
+# so that identifiers can be resolved without walking up the tree.
 
-from cStringIO import StringIO
 from functools import partial
 from itertools import chain, ifilter, imap
+from string import Formatter
 
 from java2python.lang import tokens
-from java2python.lib import FS, colors
+from java2python.lib import FS, colors, instrument
 
 
 class Factory(object):
@@ -40,17 +57,118 @@ class Factory(object):
     the factory locates the type and returns a constructor for it with
     the config object pre-applied.
 
+    The constructors are made once per factory:  those for the types
+    registered when the factory is created are set as attributes right
+    away, and those for types registered later are set when first
+    requested.
+
     """
     types = {}
 
     def __init__(self, config):
 	self.config =  config
+	for name, cls in self.types.items():
+	    setattr(self, name, partial(cls, config))
+
+    @classmethod
+    def forConfig(cls, config):
+	""" Returns the factory shared by the templates of the given config.
+
+	The factory is kept in the derived values of the config, so it
+	lives as long as the config does.
+	"""
+	try:
+	    return config.derived['factory']
+	except (KeyError, ):
+	    factory = config.derived['factory'] = cls(config)
+	    return factory
 
     def __getattr__(self, name):
 	try:
-	    return partial(self.types[name], self.config)
+	    cls = self.types[name]
 	except (KeyError, ):
 	    raise AttributeError('Factory missing "{0}" type.'.format(name))
+	constructor = partial(cls, self.config)
+	setattr(self, name, constructor)
+	return constructor
+
+    def exprChain(self, head, formats, parent):
+	""" Links a new expression for each format string to the given head.
+
+	This is the layout used for argument lists.  For each format
+	string, the left side of the current link is set to a new
+	expression with that format string and the right side is set to
+	a new, empty expression, which becomes the next link.  All of the
+	new expressions are children of the given parent.  Returns the
+	list of left expressions.
+	"""
+	expr, items = self.expr, []
+	for fs in formats:
+	    head.left = item = expr(fs=fs, parent=parent)
+	    head.right = head = expr(parent=parent)
+	    items.append(item)
+	return items
+
+
+class Fragments(list):
+    """ Fragments -> a list of strings that can be written to like a file. """
+    write = list.append
+
+
+## format strings that can be rendered from the fragment stack, mapped
+## to their (literal, field name) pairs.  None marks the format strings
+## that use anything other than plain {left} and {right} fields.
+formatFieldCache, formatFieldCacheSize = {}, 4096
+
+
+def formatFields(fs):
+    """ Returns the (literal, field name) pairs of the given format string. """
+    try:
+	return formatFieldCache[fs]
+    except (KeyError, ):
+	pass
+    fields = []
+    try:
+	for literal, name, spec, conversion in Formatter().parse(fs):
+	    if name is not None and (name not in ('left', 'right') or spec or conversion):
+		fields = None
+		break
+	    fields.append((literal, name))
+    except (TypeError, ValueError, ):
+	fields = None
+    if len(formatFieldCache) >= formatFieldCacheSize:
+	formatFieldCache.clear()
+    formatFieldCache[fs] = fields
+    return fields
+
+
+class LazyList(object):
+    """ LazyList -> a list attribute that is created when first used.
+
+    The list is kept in the given slot descriptor of the instance.
+    """
+    factory = list
+
+    def __init__(self, slot):
+	self.slot = slot
+
+    def __get__(self, obj, cls=None):
+	if obj is None:
+	    return self
+	try:
+	    return self.slot.__get__(obj, cls)
+	except (AttributeError, ):
+	    value = self.factory()
+	    self.slot.__set__(obj, value)
+	    return value
+
+    def __set__(self, obj, value):
+	self.slot.__set__(obj, value)
+
+
+class LazySet(LazyList):
+    """ LazySet -> a set attribute that is created when first used. """
+    factory = set
 
 
 class FactoryTypeDetector(type):
@@ -113,19 +231,18 @@ class Base(object):
     __metaclass__ = FactoryTypeDetector
     isAnnotation = isClass = isComment = isEnum = isExpression = \
     isInterface = isMethod = isModule = isStatement = False
+    lazyLists = ('bases', 'children', 'decorators', 'modifiers', 'parameters', 'variables')
+    __slots__ = ('__dict__', 'config', 'enclosingClass', 'enclosingMethod', 'factory',
+		 'headItems', 'name', 'parent', 'type', '_symbols') + \
+	tuple('_' + name for name in lazyLists)
 
     def __init__(self, config, name=None, type=None, parent=None):
-	self.bases = []
-	self.children = []
 	self.config = config
-	self.decorators = []
-	self.factory = Factory(config)
-	self.modifiers = []
+	self.factory = Factory.forConfig(config)
 	self.name = name
-	self.parameters = []
 	self.parent = parent
 	self.type = type
-	self.variables = []
+	self.setScope(parent)
 	if parent:
 	    parent.children.append(self)
 
@@ -148,52 +265,86 @@ class Base(object):
 	""" Adds child to this objecs children and sets the childs parent. """
 	self.children.insert(index, child)
 	child.parent = self
+	child.setScope(self)
+
+    def addParameter(self, param):
+	""" Adds the given parameter to this template and its symbol table. """
+	self.parameters.append(param)
+	self.symbols.add(param['name'])
+	return param
+
+    def addVariable(self, name):
+	""" Adds the named variable to this template and its symbol table. """
+	self.variables.append(name)
+	self.symbols.add(name)
 
     def altIdent(self, name):
-	""" Returns an alternate identifier for the one given. """
-	for klass in self.parents(lambda v:v.isClass):
-	    if name in klass.variables:
-		try:
-		    method = self.parents(lambda v:v.isMethod).next()
-		except (StopIteration, ):
+	""" Returns an alternate identifier for the one given.
+
+	The name is looked up in the enclosing classes, innermost first.
+	Names declared in a class but not in the enclosing method are
+	qualified with 'self' or 'cls'.
+	"""
+	klass = self.enclosingClass
+	while klass:
+	    if name in klass.symbols:
+		method = self.enclosingMethod
+		if method is None or name in method.symbols:
 		    return name
-		if name in [p['name'] for p in method.parameters]:
-		    return name
-                if name in method.variables:
-                    return name
 		return ('cls' if method.isStatic else 'self') + '.' + name
+	    klass = klass.parent.enclosingClass if klass.parent else None
 	return name
 
     def configHandler(self, part, suffix='Handler', default=None):
 	""" Returns the config handler for this type of template. """
 	name = '{0}{1}{2}'.format(self.typeName, part, suffix)
-	return self.config.last(name, default)
+	handler = self.config.last(name, default)
+	if instrument.recorder and callable(handler):
+	    handler = instrument.recorder.timedHandler(name, handler)
+	return handler
 
     def configHandlers(self, part, suffix='Handlers'):
-	""" Returns config handlers for this type of template """
-	name = '{0}{1}{2}'.format(self.typeName, part, suffix)
-	return imap(self.toIter, self.config.last(name, ()))
+	""" Returns config handlers for this type of template
+
+	The handlers are resolved once per config and template type, and
+	again while a recorder of `java2python.lib.instrument` is
+	installed.  The timed handlers are dropped when it is disabled.
+	"""
+	recorder = instrument.recorder
+	key = ('configHandlers', self.typeName, part, suffix, recorder)
+	try:
+	    return self.config.derived[key]
+	except (KeyError, ):
+	    name = '{0}{1}{2}'.format(self.typeName, part, suffix)
+	    values = self.config.last(name, ())
+	    if recorder:
+		handlers = tuple(recorder.timedHandler(name, self.toIter(v), v) for v in values)
+		return recorder.storeDerived(self.config.derived, key, handlers)
+	    handlers = self.config.derived[key] = tuple(imap(self.toIter, values))
+	    return handlers
 
     def dump(self, fd, level=0):
-	""" Writes the Python source code for this template to the given file. """
-	indent, isNotNone = level * self.indent, lambda x:x is not None
-	lineFormat = '{0}{1}\n'.format
-	for line in ifilter(isNotNone, self.iterPrologue()):
-	    line = lineFormat(indent, line)
-	    fd.write(line if line.strip() else '\n')
-	for item in ifilter(isNotNone, self.iterHead()):
-	    item.dump(fd, level+1)
-	for item in self.iterBody():
-	    item.dump(fd, level+1)
-	for line in ifilter(isNotNone, self.iterEpilogue()):
-	    line = lineFormat(indent, line)
-	    fd.write(line if line.strip() else '\n')
+	""" Writes the Python source code for this template to the given file.
+
+	Nested templates that use this method are written from a stack
+	of `iterDump` generators instead of by recursion; others have
+	their own `dump` method called.
+	"""
+	baseDump, stack = Base.dump.im_func, [self.iterDump(fd, level)]
+	while stack:
+	    for item, itemLevel in stack[-1]:
+		if getattr(type(item).dump, 'im_func', None) is baseDump:
+		    stack.append(item.iterDump(fd, itemLevel))
+		    break
+		item.dump(fd, itemLevel)
+	    else:
+		stack.pop()
 
     def dumps(self, level=0):
 	""" Dumps this template to a string. """
-	fd = StringIO()
+	fd = Fragments()
 	self.dump(fd, level)
-	return fd.getvalue()
+	return ''.join(fd)
 
     def dumpRepr(self, fd, level=0):
 	""" Writes a debug string for this template to the given file. """
@@ -202,6 +353,27 @@ class Base(object):
 	for child in ifilter(None, self.children):
 	    getattr(child, 'dumpRepr', default)(fd, level+1)
 
+    def iterDump(self, fd, level):
+	""" Writes the lines of this template and yields its nested items.
+
+	Each item is yielded with its level and must be written before
+	the next one is requested; the epilogue is written last.
+	"""
+	indent, isNotNone = level * self.indent, lambda x:x is not None
+	lineFormat = '{0}{1}\n'.format
+	for line in ifilter(isNotNone, self.iterPrologue()):
+	    line = lineFormat(indent, line)
+	    fd.write(line if line.strip() else '\n')
+	self.headItems = head = list(ifilter(isNotNone, self.iterHead()))
+	for item in head:
+	    yield item, level+1
+	for item in self.iterBody():
+	    yield item, level+1
+	self.headItems = None
+	for line in ifilter(isNotNone, self.iterEpilogue()):
+	    line = lineFormat(indent, line)
+	    fd.write(line if line.strip() else '\n')
+
     @property
     def indent(self):
 	""" Returns the indent string for this item. """
@@ -235,6 +407,15 @@ class Base(object):
 	""" Yields the items in the body of this template. """
         return iter(self.children)
 
+    def hasHead(self):
+	""" True if this template has any items in its head.
+
+	While the template is being written, the head items written for
+	it are used instead of running the head handlers again.
+	"""
+	head = getattr(self, 'headItems', None)
+	return any(self.iterHead() if head is None else head)
+
     def iterEpilogue(self):
 	""" Yields the items in the epilogue of this template. """
 	return chain(*(h(self) for h in self.configHandlers('Epilogue')))
@@ -253,14 +434,24 @@ class Base(object):
 		yield self
 	    self = self.parent
 
+    def setScope(self, parent):
+	""" Sets the enclosing class and method of this template from its parent. """
+	klass, method = (parent.enclosingClass, parent.enclosingMethod) if parent else (None, None)
+	self.enclosingClass = self if self.isClass else klass
+	self.enclosingMethod = self if self.isMethod else method
+
     def find(self, pred=lambda v:True):
         """ Yield each child in the family tree. """
-        for child in self.children:
-            if pred(child):
-                yield child
-            if hasattr(child, 'find'):
-                for value in child.find(pred):
-                    yield value
+	stack = [iter(self.children)]
+	while stack:
+	    for child in stack[-1]:
+		if pred(child):
+		    yield child
+		if hasattr(child, 'find'):
+		    stack.append(iter(child.children))
+		    break
+	    else:
+		stack.pop()
 
     @property
     def className(self):
@@ -291,11 +482,17 @@ class Base(object):
 	    return wrapper
 
 
+for name in Base.lazyLists:
+    setattr(Base, name, LazyList(getattr(Base, '_' + name)))
+Base.symbols = LazySet(Base._symbols)
+
+
 class Expression(Base):
     """ Expression -> formatting for Python expressions.
 
     """
     isExpression = True
+    __slots__ = ('left', 'right', 'fs', 'tail')
 
     def __init__(self, config, left='', right='', fs=FS.lr, parent=None, tail=''):
 	super(Expression, self).__init__(config, parent=parent)
@@ -317,8 +514,32 @@ class Expression(Base):
 	return ' '.join(parts)
 
     def __str__(self):
-	""" Returns the Python source code representation of this template. """
-	return self.fs.format(left=self.left, right=self.right) + self.tail
+	""" Returns the Python source code representation of this template.
+
+	Nested expressions are rendered in place from a stack of values
+	instead of by formatting each one into a string of its own.
+	Expressions with other format fields, and values of other types,
+	are formatted the usual way.
+	"""
+	fields = formatFields(self.fs)
+	if fields is None:
+	    return self.fs.format(left=self.left, right=self.right) + self.tail
+	parts, stack = [], [self.tail]
+	stack.extend(self.iterFieldValues(fields))
+	while stack:
+	    value = stack.pop()
+	    if isinstance(value, (basestring, )):
+		parts.append(value)
+	    elif type(value).__str__ == Expression.__str__:
+		fields = formatFields(value.fs)
+		if fields is None:
+		    parts.append(format(value))
+		else:
+		    stack.append(value.tail)
+		    stack.extend(value.iterFieldValues(fields))
+	    else:
+		parts.append(format(value))
+	return ''.join(parts)
 
     def dump(self, fd, level=0):
 	""" Writes the Python source code for this template to the given file. """
@@ -332,6 +553,14 @@ class Expression(Base):
 	    dumper = getattr(obj, 'dumpRepr', lambda x, y:None)
 	    dumper(fd, level+1)
 
+    def iterFieldValues(self, fields):
+	""" Yields the literals and field values of this expression in reverse. """
+	for literal, name in reversed(fields):
+	    if name is not None:
+		yield getattr(self, name)
+	    if literal:
+		yield literal
+
     @property
     def isComment(self):
 	""" True if this expression is a comment. """
@@ -346,6 +575,7 @@ class Comment(Expression):
 
     """
     isComment = True
+    __slots__ = ()
 
     def __repr__(self):
 	""" Returns the debug string representation of this comment. """
@@ -360,12 +590,14 @@ class Statement(Base):
 
     """
     isStatement = True
+    __slots__ = ('keyword', 'expr')
 
     def __init__(self, config, keyword, fs=FS.lr, parent=None):
 	super(Statement, self).__init__(config, parent=parent)
 	self.keyword = keyword
 	self.expr = self.factory.expr(left=keyword, fs=fs)
 	self.expr.parent = self
+	self.expr.setScope(self)
 
     def __repr__(self):
 	""" Returns the debug string representation of this statement. """
@@ -382,6 +614,32 @@ class Module(Base):
 
     """
     isModule = True
+    __slots__ = ('declarations', 'declaredTypes')
+
+    def __init__(self, config, name=None, type=None, parent=None):
+	super(Module, self).__init__(config, name, type, parent)
+	self.declarations = {'ImportDeclaration':[], 'PackageDeclaration':[]}
+	self.declaredTypes = {}
+
+    def addType(self, template):
+	""" Adds a type template to the index of types declared in this module. """
+	self.declaredTypes.setdefault(template.name, []).append(template)
+
+    @property
+    def declaredTypeNames(self):
+	""" Returns the names of the types declared in this module. """
+	return sorted(t.name for ts in self.declaredTypes.values() for t in ts)
+
+    @property
+    def importNames(self):
+	""" Returns the names given in the import declarations of this module. """
+	return self.declarations['ImportDeclaration']
+
+    @property
+    def packageName(self):
+	""" Returns the name given in the package declaration, or None. """
+	names = self.declarations['PackageDeclaration']
+	return names[0] if names else None
 
     def iterBody(self):
 	""" Yields the items in the body of this template. """
@@ -397,6 +655,7 @@ class Module(Base):
 
 class ClassMethodSharedMixin(object):
     """ ClassMethodSharedMixin -> shared methods for Class and Method types. """
+    __slots__ = ()
 
     def iterPrologue(self):
 	""" Yields the items in the prologue of this template. """
@@ -409,6 +668,7 @@ class Class(ClassMethodSharedMixin, Base):
 
     """
     isClass = True
+    __slots__ = ()
 
     def iterBases(self):
 	""" Yields the base classes for this type. """
@@ -436,7 +696,7 @@ class Class(ClassMethodSharedMixin, Base):
 		prev = item
         for handler in self.configHandlers('PostWalk'):
             handler(self)
-	head = any(self.iterHead())
+	head = self.hasHead()
 	body = list(super(Class, self).iterBody())
 	tail = () if (body or head) else [self.factory.expr(left='pass')]
 	body = () if tail else sprinkleBlanks(body)
@@ -448,6 +708,7 @@ class Annotation(Class):
 
     """
     isAnnotation = True
+    __slots__ = ()
 
     def __init__(self, config, name=None, type=None, parent=None):
 	super(Annotation, self).__init__(config, name, type, parent)
@@ -458,6 +719,7 @@ class Enum(Class):
 
     """
     isEnum = True
+    __slots__ = ()
 
 
 class Interface(Class):
@@ -465,10 +727,12 @@ class Interface(Class):
 
     """
     isInterface = True
+    __slots__ = ()
 
 
 class MethodContent(Base):
     """ MethodContent -> formatting for content within Python methods. """
+    __slots__ = ()
 
 
 class Method(ClassMethodSharedMixin, Base):
@@ -476,10 +740,11 @@ class Method(ClassMethodSharedMixin, Base):
 
     """
     isMethod = True
+    __slots__ = ()
 
     def __init__(self, config, name=None, type=None, parent=None):
 	super(Method, self).__init__(config, name, type, parent)
-	self.parameters.append(self.makeParam('self', 'object'))
+	self.addParameter(self.makeParam('self', 'object'))
 
     def iterParams(self):
         """ Yields the parameters of this method template. """
@@ -496,7 +761,7 @@ class Method(ClassMethodSharedMixin, Base):
 
     def iterBody(self):
 	""" Yields the items in the body of this method template. """
-	head = any(self.iterHead())
+	head = self.hasHead()
 	body = list(super(Method, self).iterBody())
 	tail = () if (body or head) else [self.factory.expr(left='pass')]
 	return chain(body, tail)
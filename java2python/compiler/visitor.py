@@ -4,21 +4,39 @@
 ##
 # Needs some introductory comments.
 
+from collections import OrderedDict
 from functools import reduce, partial
 from itertools import ifilter, ifilterfalse, izip, tee
 from logging import debug
 from re import compile as recompile, sub as resub
+from string import Formatter
 
 from java2python.lang import tokens
+from java2python.lang.base import CommentIndex
+from java2python.lang.selector import Selector
 from java2python.lib import FS
 
 
+## tasks on the stack of Base.walk
+walkNode, walkChildEnd, walkEnd = range(3)
+
+
 class Memo(object):
     """ Memo -> AST walking luggage.
 
+    The `deferred` list is set while an accept method runs during a
+    walk; `zipWalk` adds its walks to it instead of recursing.  The
+    `walked` mapping holds the templates that have walked nodes, in the
+    order their walks finished, until the outermost walk is done.
     """
-    def __init__(self):
+    def __init__(self, walked=None):
 	self.comments, self.last = set(), 0
+	self.deferred = None
+	self.walked = walked
+
+    def fork(self):
+	""" Returns a new memo that shares the walked templates of this one. """
+	return Memo(self.walked)
 
 
 class Base(object):
@@ -26,30 +44,67 @@ class Base(object):
 
     """
     commentSubs = map(recompile, ['^\s*/(\*)+', '(\*)+/\s*$', '^\s*//'])
+    missingAcceptors = set()
 
     def accept(self, node, memo):
 	""" Accept a node, possibly creating a child visitor. """
-	tokType = tokens.map.get(node.token.type)
-	missing = lambda node, memo:self
-	call = getattr(self, 'accept{0}'.format(tokens.title(tokType)), missing)
-	if call is missing:
-	    debug('no visitor accept method for %s', tokType)
-        return call(node, memo)
+	acceptors = type(self).__dict__.get('acceptors')
+	if acceptors is None:
+	    acceptors = self.acceptorTable()
+	call = acceptors.get(node.token.type)
+	if call is None:
+	    return self.acceptMissing(node, memo)
+        return call(self, node, memo)
+
+    def acceptMissing(self, node, memo):
+	""" Accept a node without an accept method; logs each type once. """
+	key = (type(self), node.token.type)
+	if key not in self.missingAcceptors:
+	    self.missingAcceptors.add(key)
+	    debug('no visitor accept method for %s', tokens.map.get(node.token.type))
+	return self
+
+    @classmethod
+    def acceptorTable(cls):
+	""" Returns the accept table of this class, making it on first use.
+
+	Each class keeps its own table as its `acceptors` attribute, so
+	subclasses (like types given in a config) get their own accept
+	methods without any setup, and `accept` does one lookup per node
+	instead of deriving and finding the method name.
+	"""
+	acceptors = cls.__dict__.get('acceptors')
+	if acceptors is None:
+	    acceptors = cls.acceptors = cls.makeAcceptors()
+	return acceptors
+
+    @classmethod
+    def makeAcceptors(cls):
+	""" Returns a mapping of token type to accept function for this class. """
+	acceptors = {}
+	for tokType, name in tokens.map.items():
+	    call = getattr(cls, 'accept{0}'.format(tokens.title(name)), None)
+	    if call is not None:
+		acceptors[tokType] = call.im_func
+	return acceptors
 
     def insertComments(self, tmpl, tree, index, memo):
 	""" Add comments to the template from tokens in the tree. """
-	prefix = self.config.last('commentPrefix', '# ')
-	cache, parser, comTypes = memo.comments, tree.parser, tokens.commentTypes
-	comNew = lambda t:t.type in comTypes and t.index not in cache
-	for tok in ifilter(comNew, parser.input.tokens[memo.last:index]):
+	stream = tree.parser.input
+	comments = CommentIndex.forStream(stream).select(memo.last, index)
+	memo.last = index
+	if not comments:
+	    return
+	prefix, cache = self.config.last('commentPrefix', '# '), memo.comments
+	comNew = lambda t:t.index not in cache
+	for tok in ifilter(comNew, comments):
 	    cache.add(tok.index)
-	    if tmpl.isExpression and tok.line==parser.input.tokens[index].line:
+	    if tmpl.isExpression and tok.line==stream.tokens[index].line:
   	        tmpl.tail += prefix if not tmpl.tail.startswith(prefix) else ''
 		tmpl.tail += ''.join(self.stripComment(tok.text))
 	    else:
 		for line in self.stripComment(tok.text):
 		    self.factory.comment(left=prefix, right=line, parent=self)
-	memo.last = index
 
     def stripComment(self, text):
 	""" Regex substitutions for comments; removes comment characters. """
@@ -58,29 +113,77 @@ class Base(object):
 	    yield reduce(subText, self.commentSubs, text)
 
     def walk(self, tree, memo=None):
-	""" Depth-first visiting of the given AST. """
+	""" Depth-first visiting of the given AST.
+
+	The walk keeps its pending work on an explicit stack instead of
+	recursing for each level of the tree.  For each node, comments
+	before the node are inserted, the node is accepted, the walks
+	deferred by `zipWalk` during the accept are run, the children are
+	walked by the visitor the accept returned, and finally the
+	comments up to the end of the node are inserted.  This is the
+	same order as a recursive walk.
+
+	The PostWalk mutators of each template that walked any nodes are
+	called once, when the outermost walk is done.  The templates are
+	taken in the order in which they finished their last walk, so the
+	mutators of nested templates are called before the mutators of
+	the templates containing them.
+	"""
 	if not tree:
 	    return
 	memo = Memo() if memo is None else memo
-	comIns = self.insertComments
-	comIns(self, tree, tree.tokenStartIndex, memo)
-	visitor = self.accept(tree, memo)
-	if visitor:
-	    for child in tree.children:
-		visitor.walk(child, memo)
-		comIns(visitor, child, child.tokenStopIndex, memo)
-	comIns(self, tree, tree.tokenStopIndex, memo)
-	if tree.isJavaSource:
-	    comIns(self, tree, len(tree.parser.input.tokens), memo)
-	# fixme: we're calling the mutators far too frequently instead
-	# of only once per object after its walk is finished.
-	for handler in self.configHandlers('PostWalk', suffix='Mutators'):
-	    handler(self)
+	saved, stack = memo.deferred, [(walkNode, self, self, tree)]
+	outermost = memo.walked is None
+	if outermost:
+	    memo.walked = OrderedDict()
+	try:
+	    while stack:
+		task, walker, visitor, node = stack.pop()
+		if task == walkNode:
+		    if not node:
+			continue
+		    walker.insertComments(walker, node, node.tokenStartIndex, memo)
+		    memo.deferred = deferred = []
+		    visitor = walker.accept(node, memo)
+		    memo.deferred = saved
+		    stack.append((walkEnd, walker, walker, node))
+		    if visitor:
+			for child in reversed(node.children):
+			    stack.append((walkChildEnd, walker, visitor, child))
+			    stack.append((walkNode, visitor, visitor, child))
+		    for child, childVisitor in reversed(deferred):
+			stack.append((walkNode, childVisitor, childVisitor, child))
+		elif task == walkChildEnd:
+		    walker.insertComments(visitor, node, node.tokenStopIndex, memo)
+		else:
+		    walker.insertComments(walker, node, node.tokenStopIndex, memo)
+		    if node.isJavaSource:
+			count = len(node.parser.input.tokens)
+			walker.insertComments(walker, node, count, memo)
+		    memo.walked.pop(walker, None)
+		    memo.walked[walker] = True
+	finally:
+	    memo.deferred = saved
+	    if outermost:
+		walked, memo.walked = memo.walked, None
+	if outermost:
+	    for template in walked:
+		for handler in template.configHandlers('PostWalk', suffix='Mutators'):
+		    handler(template)
 
     def zipWalk(self, nodes, visitors, memo):
-	""" Walk the given nodes zipped with the given visitors. """
-	for node, visitor in izip(nodes, visitors):
-	    visitor.walk(node, memo)
+	""" Walk the given nodes zipped with the given visitors.
+
+	When called from an accept method during a walk, the walks are
+	deferred and run (in order) right after the accept method returns,
+	so calls to this method must come after everything else the
+	accept method does.
+	"""
+	if memo.deferred is None:
+	    for node, visitor in izip(nodes, visitors):
+		visitor.walk(node, memo)
+	else:
+	    memo.deferred.extend(izip(nodes, visitors))
 
     def nodeTypeToString(self, node):
 	""" Returns the TYPE or QUALIFIED_TYPE_IDENT of the given node. """
@@ -108,8 +211,11 @@ class TypeAcceptor(object):
 	def acceptType(self, node, memo):
 	    """ Creates and returns a new template for a type. """
 	    name = node.firstChildOfType(tokens.IDENT).text
-	    self.variables.append(name)
-	    return getattr(self.factory, ft)(name=name, parent=self)
+	    self.addVariable(name)
+	    template = getattr(self.factory, ft)(name=name, parent=self)
+	    for module in self.parents(lambda x:x.isModule):
+		module.addType(template)
+	    return template
 	return acceptType
 
     acceptAt = makeAcceptType('at')
@@ -128,6 +234,7 @@ class Module(TypeAcceptor, Base):
 	    """ Processes a decl by creating a new template expression. """
 	    expr = self.factory.expr()
 	    expr.walk(node.firstChild(), memo)
+	    self.declarations[part].append(unicode(expr))
 	    handler = self.configHandler(part)
 	    if handler:
 		handler(self, expr)
@@ -161,7 +268,7 @@ class ModifiersAcceptor(object):
 	    if defKey:
 		deco = self.factory.expr(left=name, fs='@{left}({right})')
 		deco.right = right = self.factory.expr(parent=deco)
-		right.walk(defKey.firstChild())
+		right.walk(defKey.firstChild(), memo.fork())
 	    else:
 		deco = self.factory.expr(left=name, fs='@{left}({right})')
 		arg = deco.right = self.factory.expr(parent=deco)
@@ -179,7 +286,9 @@ class ModifiersAcceptor(object):
 	if root.parentType in tokens.methodTypes:
 	    self.modifiers.extend(n.text for n in root.children)
 	    if self.isStatic and self.parameters:
+		self.symbols.discard(self.parameters[0]['name'])
 		self.parameters[0]['name'] = 'cls'
+		self.symbols.add('cls')
 	self.modifiers.append(branch.text)
 
 
@@ -189,7 +298,7 @@ class VarAcceptor(object):
 	varDecls = node.firstChildOfType(tokens.VAR_DECLARATOR_LIST)
 	for varDecl in varDecls.childrenOfType(tokens.VAR_DECLARATOR):
 	    ident = varDecl.firstChildOfType(tokens.IDENT)
-	    self.variables.append(ident.text)
+	    self.addVariable(ident.text)
 	    identExp = self.factory.expr(left=ident.text, parent=self)
 	    declExp = varDecl.firstChildOfType(tokens.EXPR)
 	    assgnExp = identExp.pushRight(' = ')
@@ -199,11 +308,10 @@ class VarAcceptor(object):
             elif declArr:
 		assgnExp.right = exp = self.factory.expr(fs='['+FS.lr+']', parent=identExp)
 		children = list(declArr.childrenOfType(tokens.EXPR))
-		for child in children:
-		    fs = FS.lr if child is children[-1] else FS.lr + ', '
-		    exp.left = self.factory.expr(fs=fs, parent=identExp)
-		    exp.left.walk(child, memo)
-		    exp.right = exp = self.factory.expr(parent=identExp)
+		formats = [FS.lr + ', '] * (len(children) - 1) + [FS.lr] if children else []
+		items = self.factory.exprChain(exp, formats, identExp)
+		for child, item in zip(children, items):
+		    item.walk(child, memo)
 	    else:
 		if node.firstChildOfType(tokens.TYPE).firstChildOfType(tokens.ARRAY_DECLARATOR_LIST):
 		    val = assgnExp.pushRight('[]')
@@ -296,13 +404,13 @@ class Annotation(Class):
 		expr.walk(default, memo)
 	    else:
 		expr = None
-	    meth.parameters.append(self.makeParam(name, type, default=expr))
+	    meth.addParameter(self.makeParam(name, type, default=expr))
 	    factory(left=name, right=name)
 
     def addCall(self, args, memo):
 	""" Make a __call__ function in this class (so it's a decorator). """
 	meth = self.factory.method(parent=self, name='__call__')
-	meth.parameters.append(self.makeParam('obj', 'object'))
+	meth.addParameter(self.makeParam('obj', 'object'))
 	factory = partial(self.factory.expr, parent=meth)
 	factory(fs='setattr(obj, self.__class__.__name__, self)')
 	factory(fs='return obj')
@@ -348,7 +456,7 @@ class MethodContent(Base):
     def acceptAssert(self, node, memo):
 	""" Accept and process an assert statement. """
 	assertStat = self.factory.statement('assert', fs=FS.lsr, parent=self)
-	assertStat.expr.walk(node.firstChild(), memo)
+	self.zipWalk([node.firstChild()], [assertStat.expr], memo)
 
     def acceptBreak(self, node, memo):
 	""" Accept and process a break statement. """
@@ -366,7 +474,7 @@ class MethodContent(Base):
 	block = node.firstChildOfType(tokens.BLOCK_SCOPE)
 	self.expr.fs = FS.lsrc
 	self.expr.right = self.factory.expr(fs=FS.l+' as '+FS.r, left=cname, right=cvar)
-	self.walk(block, memo)
+	self.zipWalk([block], [self], memo)
 
     def acceptDo(self, node, memo):
 	""" Accept and process a do-while block. """
@@ -397,13 +505,13 @@ class MethodContent(Base):
 
     def acceptFor(self, node, memo):
 	""" Accept and process a 'for' statement. """
-	self.walk(node.firstChildOfType(tokens.FOR_INIT))
+	self.walk(node.firstChildOfType(tokens.FOR_INIT), memo.fork())
 	whileStat = self.factory.statement('while', fs=FS.lsrc, parent=self)
-	whileStat.expr.walk(node.firstChildOfType(tokens.FOR_CONDITION))
+	whileStat.expr.walk(node.firstChildOfType(tokens.FOR_CONDITION), memo.fork())
 	whileBlock = self.factory.methodContent(parent=self)
-	whileBlock.walk(node.firstChildOfType(tokens.BLOCK_SCOPE))
+	whileBlock.walk(node.firstChildOfType(tokens.BLOCK_SCOPE), memo.fork())
 	updateStat = self.factory.expr(parent=whileBlock)
-	updateStat.walk(node.firstChildOfType(tokens.FOR_UPDATE))
+	updateStat.walk(node.firstChildOfType(tokens.FOR_UPDATE), memo.fork())
 
     def acceptForEach(self, node, memo):
 	""" Accept and process a 'for each' style statement. """
@@ -457,7 +565,7 @@ class MethodContent(Base):
 	    return
 	# we have at least one node...
 	parExpr = self.factory.expr()
-	parExpr.walk(parNode)
+	parExpr.walk(parNode, memo.fork())
 	eqFs = FS.l + '==' + FS.r
 	for caseIdx, caseNode in enumerate(caseNodes):
 	    isDefault, isFirst = caseNode.type==tokens.DEFAULT, caseIdx==0
@@ -471,7 +579,7 @@ class MethodContent(Base):
 
 	    if not isDefault:
 		right = self.factory.expr()
-		right.walk(caseNode.firstChildOfType(tokens.EXPR))
+		right.walk(caseNode.firstChildOfType(tokens.EXPR), memo.fork())
 		caseExpr.expr.right = self.factory.expr(left=parExpr, right=right, fs=eqFs)
 		caseContent = self.factory.methodContent(parent=self)
 		for child in caseNode.children[1:]:
@@ -490,7 +598,7 @@ class MethodContent(Base):
     def acceptThrow(self, node, memo):
 	""" Accept and process a throw statement. """
 	throw = self.factory.statement('raise', fs=FS.lsr, parent=self)
-	throw.expr.walk(node.children[0], memo)
+	self.zipWalk(node.children[0:1], [throw.expr], memo)
 
     def acceptTry(self, node, memo):
 	""" Accept and process a try/catch block. """
@@ -525,15 +633,14 @@ class MethodContent(Base):
 	    expr = self.factory.expr(left='return', parent=self)
 	    if node.children:
 		expr.fs, expr.right = FS.lsr, self.factory.expr(parent=expr)
-		expr.right.walk(node, memo)
+		self.zipWalk([node], [expr.right], memo)
 
     def acceptWhile(self, node, memo):
 	""" Accept and process a while block. """
 	# WHILE - PARENTESIZED_EXPR - BLOCK_SCOPE
 	parNode, blkNode = node.children
 	whileStat = self.factory.statement('while', fs=FS.lsrc, parent=self)
-	whileStat.expr.walk(parNode, memo)
-	whileStat.walk(blkNode, memo)
+	self.zipWalk([parNode, blkNode], [whileStat.expr, whileStat], memo)
 
 
 class Method(VarAcceptor, ModifiersAcceptor, MethodContent):
@@ -544,14 +651,14 @@ class Method(VarAcceptor, ModifiersAcceptor, MethodContent):
 	""" Accept and process a single parameter declaration. """
 	ident = node.firstChildOfType(tokens.IDENT)
 	ptype = self.nodeTypeToString(node)
-	self.parameters.append(self.makeParam(ident.text, ptype))
+	self.addParameter(self.makeParam(ident.text, ptype))
 	return self
 
     def acceptFormalParamVarargDecl(self, node, memo):
 	""" Accept and process a var arg declaration. """
 	ident = node.firstChildOfType(tokens.IDENT)
 	param = {'name':'*{0}'.format(ident.text), 'type':'A'}
-	self.parameters.append(param)
+	self.addParameter(param)
 	return self
 
 
@@ -658,29 +765,32 @@ class Expression(Base):
 	factory = self.factory.expr
 	self.fs = 'bsr(' + FS.l + ', ' + FS.r + ')'
 	self.left, self.right = visitors = factory(parent=self), factory()
-	self.zipWalk(node.children, visitors, memo)
 	module = self.parents(lambda x:x.isModule).next()
 	module.needsBsrFunc = True
+	self.zipWalk(node.children, visitors, memo)
 
     def acceptBitShiftRightAssign(self, node, memo):
 	""" Accept and process a bit shift right expression with assignment. """
 	factory = self.factory.expr
 	self.fs = FS.l + ' = bsr(' + FS.l + ', ' + FS.r + ')'
 	self.left, self.right = visitors = factory(parent=self), factory()
-	self.zipWalk(node.children, visitors, memo)
 	module = self.parents(lambda x:x.isModule).next()
 	module.needsBsrFunc = True
+	self.zipWalk(node.children, visitors, memo)
 
     def acceptClassConstructorCall(self, node, memo):
 	""" Accept and process a class constructor call. """
-	self.acceptMethodCall(node, memo)
 	typeIdent = node.firstChildOfType(tokens.QUALIFIED_TYPE_IDENT)
 	if typeIdent and typeIdent.children:
 	    names = [self.altIdent(child.text) for child in typeIdent.children]
-	    self.left = '.'.join(names)
+	    self.walkCall(node, memo, '.'.join(names))
+	else:
+	    self.walkCall(node, memo)
 
     def acceptDot(self, node, memo):
 	""" Accept and process a dotted expression. """
+	if node.parentType != tokens.METHOD_CALL and self.mapFieldAccess(node, memo):
+	    return
 	expr = self.factory.expr
 	self.fs = FS.l + '.' + FS.r
 	self.left, self.right = visitors = expr(parent=self), expr()
@@ -698,30 +808,21 @@ class Expression(Base):
 	""" Accept and process an instanceof expression. """
 	self.fs = 'isinstance({right}, ({left}, ))'
 	self.right = self.factory.expr(parent=self)
-	self.right.walk(node.firstChildOfType(tokens.IDENT), memo)
 	self.left = self.factory.expr(parent=self)
-	self.left.walk(node.firstChildOfType(tokens.TYPE), memo)
+	nodes = node.firstChildOfType(tokens.IDENT), node.firstChildOfType(tokens.TYPE)
+	self.zipWalk(nodes, (self.right, self.left), memo)
 
     def acceptMethodCall(self, node, memo):
 	""" Accept and process a method call. """
-	# NB: this creates one too many expression levels.
-	expr = self.factory.expr
-	self.fs = FS.l + '(' + FS.r + ')'
-	self.left = expr(parent=self)
-	self.left.walk(node.firstChild(), memo)
-	children = node.firstChildOfType(tokens.ARGUMENT_LIST).children
-	self.right = arg = expr(parent=self)
-	for child in children:
-	    fs = FS.r + (', ' if child is not children[-1] else '')
-	    arg.left = expr(fs=fs, parent=self)
-	    arg.left.walk(child, memo)
-	    arg.right = arg = expr(parent=self)
+	if node.type == tokens.METHOD_CALL and self.mapMethodCall(node, memo):
+	    return
+	self.walkCall(node, memo)
 
     def acceptStaticArrayCreator(self, node, memo):
 	""" Accept and process a static array expression. """
 	self.right = self.factory.expr(fs='[None]*{left}')
 	self.right.left = self.factory.expr()
-	self.right.left.walk(node.firstChildOfType(tokens.EXPR), memo)
+	self.zipWalk([node.firstChildOfType(tokens.EXPR)], [self.right.left], memo)
 
     def acceptSuperConstructorCall(self, node, memo):
 	""" Accept and process a super constructor call. """
@@ -745,11 +846,106 @@ class Expression(Base):
 	visitors = (self.right.left, self.left, self.right.right)
 	self.zipWalk(node.children, visitors, memo)
 
+    def mapFieldAccess(self, node, memo):
+	""" Rewrites a field access with the fieldAccessSubs config table.
+
+	Returns True if an entry of the table matched the node.
+	"""
+	name = node.children[-1]
+	if name.type != tokens.IDENT or len(node.children) != 2:
+	    return False
+	entries = self.config.last('fieldAccessSubs', {}).get(name.text, ())
+	for receiver, fs in entries:
+	    if self.matchesReceiver(receiver, node.children[0]):
+		self.mapFormat(fs, node.children[0], [], memo)
+		return True
+	return False
+
+    def mapMethodCall(self, node, memo):
+	""" Rewrites a method call with the methodCallSubs config table.
+
+	Only calls with a receiver (like 'a.b()') are rewritten.  Returns
+	True if an entry of the table matched the node.
+	"""
+	callee = node.firstChild()
+	if callee.type != tokens.DOT or len(callee.children) != 2:
+	    return False
+	receiver, name = callee.children
+	if name.type != tokens.IDENT:
+	    return False
+	args = node.firstChildOfType(tokens.ARGUMENT_LIST).children
+	entries = self.config.last('methodCallSubs', {}).get(name.text, ())
+	for spec, arity, fs in entries:
+	    if arity in (None, len(args)) and self.matchesReceiver(spec, receiver):
+		self.mapFormat(fs, receiver, args, memo)
+		return True
+	return False
+
+    def matchesReceiver(self, spec, node):
+	""" True if the receiver node matches the spec of a mapping.
+
+	The spec is None to match any receiver, a dotted name to match
+	the text of the receiver, a selector that must select the node,
+	or a callable that is called with the node.
+	"""
+	if spec is None:
+	    return True
+	if isinstance(spec, (basestring, )):
+	    return spec == node.dottedName
+	if isinstance(spec, (Selector, )):
+	    return any(spec(node))
+	return spec(node)
+
+    def mapFormat(self, fs, receiver, args, memo):
+	""" Sets this expression to the format string of a mapping.
+
+	The '{receiver}' field is the receiver of the call, '{0}', '{1}',
+	etc. are the arguments and '{args}' is all of the arguments
+	separated by commas.  Each field is walked separately, so an
+	argument used twice is walked twice.
+	"""
+	expr, nodes, visitors, parts = self.factory.expr, [], [], []
+	for literal, field, spec, conversion in Formatter().parse(fs):
+	    if literal:
+		parts.append(literal)
+	    if field == 'args':
+		parts.append(expr(parent=self))
+		formats = [FS.r + ', '] * (len(args) - 1) + [FS.r] if args else []
+		visitors.extend(self.factory.exprChain(parts[-1], formats, self))
+		nodes.extend(args)
+	    elif field is not None:
+		parts.append(expr(parent=self))
+		visitors.append(parts[-1])
+		nodes.append(receiver if field == 'receiver' else args[int(field)])
+	self.fs, head = FS.lr, self
+	for part in parts:
+	    head.left = part
+	    head.right = head = expr(parent=self)
+	self.zipWalk(nodes, visitors, memo)
+
     def pushRight(self, value=''):
 	""" Creates a new right expression, sets it, and returns it. """
 	self.right = self.factory.expr(left=value, parent=self)
 	return self.right
 
+    def walkCall(self, node, memo, callee=None):
+	""" Walks the callee and the arguments of a call into this expression.
+
+	When `callee` is given, it is used as the left side instead of
+	the walked callee node.  The fields are set before the walks are
+	deferred, as `zipWalk` requires.
+	"""
+	# NB: this creates one too many expression levels.
+	expr = self.factory.expr
+	self.fs = FS.l + '(' + FS.r + ')'
+	calleeExpr = expr(parent=self)
+	self.left = calleeExpr if callee is None else callee
+	children = node.firstChildOfType(tokens.ARGUMENT_LIST).children
+	self.right = expr(parent=self)
+	formats = [FS.r + ', '] * (len(children) - 1) + [FS.r] if children else []
+	args = self.factory.exprChain(self.right, formats, self)
+	self.zipWalk([node.firstChild()] + children, [calleeExpr] + args, memo)
+
 
 class Comment(Expression):
     """ Comment -> implemented for type building in __init__.py. """
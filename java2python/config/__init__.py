@@ -1,6 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """ java2python.config -> subpackage for run-time configuration. """
+##
+# A Config resolves the values of its modules once, when it is
+# created.  Lookups with `last` and `every` are then plain dictionary
+# reads instead of attribute searches over each module.  Code that
+# rebinds names in a config module after the Config was created must
+# call `invalidate` so the change is seen.  Values computed from the
+# config by other modules (the handler chains of the templates, for
+# example) are kept in the `derived` mapping, which `invalidate` clears.
 
 from functools import reduce
 from imp import load_source
@@ -10,19 +18,38 @@ from os import path
 class Config(object):
     """ Config -> wraps multiple configuration modules """
 
+    missing = object()
+
     def __init__(self, names):
 	self.configs = [self.load(name) for name in names]
+	self.invalidate()
 
     def every(self, key, default=None):
         """ Returns the value at the given key from each config module. """
-	return [getattr(config, key, default) for config in self.configs]
+	missing = self.missing
+	values = self.everyValues.get(key)
+	if values is None:
+	    return [default] * len(self.configs)
+	return [default if value is missing else value for value in values]
 
     def last(self, key, default=None):
         """ Returns the value at the given key from the last config module to define it. """
-	for config in reversed(self.configs):
-	    if hasattr(config, key):
-		return getattr(config, key)
-	return default
+	return self.lastValues.get(key, default)
+
+    def invalidate(self):
+	""" Resolves the values of the config modules again.
+
+	Call this after changing the attributes of a loaded config
+	module.
+	"""
+	missing, lastValues, everyValues = self.missing, {}, {}
+	spaces = [vars(config) for config in self.configs]
+	for space in spaces:
+	    lastValues.update(space)
+	for key in lastValues:
+	    everyValues[key] = tuple(space.get(key, missing) for space in spaces)
+	self.lastValues, self.everyValues = lastValues, everyValues
+	self.derived = {}
 
     @staticmethod
     def load(name):
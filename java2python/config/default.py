@@ -80,6 +80,13 @@ interfaceHeadHandlers = [
 ]
 
 
+# The PostWalk mutators of a template (named like
+# 'classPostWalkMutators') are called once for each template that
+# walked any nodes, after the whole tree has been walked.  Nested
+# templates come before the templates containing them; for example,
+# the mutators of a method are called before those of its class.
+# Because of this, a mutator like basic.classContentSort is called
+# only once per class.
 interfacePostWalkMutators = [
 ]
 
@@ -133,7 +140,8 @@ moduleImportDeclarationHandler = basic.simpleImports
 # The AST transformation function uses these declarations to modify an
 # AST before compiling it to python source.  Having these declarations
 # in a config file gives clients an opportunity to change the
-# transformation behavior.
+# transformation behavior.  The transforms are applied in a single walk
+# of the tree; at each node they are tried in the order listed here.
 
 astTransforms = [
     (Type('NULL'),  transform.null2None),
@@ -160,28 +168,53 @@ astTransforms = [
 # convenience.
 
 
-# module output subs.
+# module output subs.  These are applied in order, as with re.sub, but
+# patterns that cannot match a line break are applied line by line and
+# only to lines containing their literal text; refer to
+# java2python.lib.subs for details.
 moduleOutputSubs = [
-    (r'System\.out\.println\((.*)\)', r'print \1'),
-    (r'System\.out\.print_\((.*?)\)', r'print \1,'),
-    (r'(.*?)\.equals\((.*?)\)', r'\1 == \2'),
-    (r'(.*?)\.equalsIgnoreCase\((.*?)\)', r'\1.lower() == \2.lower()'),
-    (r'([\w.]+)\.size\(\)', r'len(\1)'),
-    (r'(\w+)\.get\((.*?)\)', r'\1[\2]'),
-    (r'(\s)(\S*?)(\.toString\(\))', r'\1\2.__str__()'),
     (r'(\s)def toString', r'\1def __str__'),
-    (r'(\s)(\S*?)(\.toLowerCase\(\))', r'\1\2.lower()'),
-    (r'(\s)(\S*?)(\.length\(\))', r'\1len(\2)'),
     (r'(.*?)IndexOutOfBoundsException\((.*?)\)', r'\1IndexError(\2)'),
-    (r'\.__class__\.getName\(\)', '.__class__.__name__'),
-    (r'\.getClass\(\)', '.__class__'),
-    (r'\.getName\(\)', '.__name__'),
-    (r'\.getInterfaces\(\)', '.__bases__'),
-    #(r'String\.valueOf\((.*?)\)', r'str(\1)'),
-    #(r'(\s)(\S*?)(\.toString\(\))', r'\1str(\2)'),
 ]
 
 
+# Method call mappings.  These rewrite calls like 'a.size()' while the
+# AST is visited, so they don't apply to strings or comments.  Each key
+# is a method name (after the AST transforms; 'print' is 'print_') and
+# each value is a list of (receiver, arity, format) entries.  The first
+# entry that matches the call is used.
+#
+# The receiver is None for any receiver, a dotted name like
+# 'System.out', a selector, or a callable taking the receiver node.
+# The arity is None for any number of arguments.  The format string
+# can use the fields {receiver}, {args} (all of the arguments) and
+# {0}, {1}, etc. (single arguments).  Only calls with a receiver are
+# rewritten.
+methodCallSubs = {
+    'println' : [('System.out', None, 'print {args}')],
+    'print_' : [('System.out', None, 'print {args},')],
+    'equals' : [(None, 1, '{receiver} == {0}')],
+    'equalsIgnoreCase' : [(None, 1, '{receiver}.lower() == {0}.lower()')],
+    'size' : [(None, 0, 'len({receiver})')],
+    'get' : [(None, 1, '{receiver}[{0}]')],
+    'toString' : [(None, 0, '{receiver}.__str__()')],
+    'toLowerCase' : [(None, 0, '{receiver}.lower()')],
+    'length' : [(None, 0, 'len({receiver})')],
+    'getClass' : [(None, 0, '{receiver}.__class__')],
+    'getName' : [(None, 0, '{receiver}.__name__')],
+    'getInterfaces' : [(None, 0, '{receiver}.__bases__')],
+    #'valueOf' : [('String', 1, 'str({0})')],
+}
+
+
+# Field access mappings.  These work like the method call mappings,
+# but for field accesses like 'a.b'.  The values are lists of
+# (receiver, format) entries.
+fieldAccessSubs = {
+    #'MAX_VALUE' : [('Integer', 'sys.maxint')],
+}
+
+
 typeSubs = {
     'Boolean' : 'bool',
     'IndexOutOfBoundsException' : 'IndexError',
@@ -4,4 +4,5 @@
 from java2python.lang.JavaLexer import JavaLexer as Lexer
 from java2python.lang.JavaParser import JavaParser as Parser
 from java2python.lang.base import StringStream, TokenStream, TreeAdaptor, tokens
+from java2python.lang.fastlexer import FastLexer
 
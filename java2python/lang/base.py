@@ -10,6 +10,12 @@
 # module.  It is used to map between parser tokens and their ids and
 # vice-versa.
 #
+# * `CommentIndex`
+#
+# This class keeps the positions of the comment tokens in a token
+# stream so that the comments between two token positions can be found
+# without scanning the tokens in between.
+#
 # * `TreeAdaptor`
 #
 # This class is used by `java2python.compiler.tool`, where the
@@ -47,6 +53,7 @@
 # instances.
 #
 
+from bisect import bisect_left
 from cStringIO import StringIO
 
 from antlr3 import ANTLRStringStream as StringStream, CommonTokenStream as TokenStream
@@ -108,6 +115,36 @@ class Tokens(object):
 tokens = Tokens()
 
 
+class CommentIndex(object):
+    """ CommentIndex -> sorted positions of the comment tokens in a stream.
+
+    Use `forStream` to get the index of a stream; it is built once, on
+    first use, and kept on the stream.
+    """
+
+    def __init__(self, stream):
+	comTypes, toks = tokens.commentTypes, stream.tokens
+	self.size = len(toks)
+	self.positions = [i for i, t in enumerate(toks) if t.type in comTypes]
+	self.comments = [toks[i] for i in self.positions]
+
+    @classmethod
+    def forStream(cls, stream):
+	""" Returns the comment index of the given token stream. """
+	index = getattr(stream, 'commentIndex', None)
+	if index is None or index.size != len(stream.tokens):
+	    index = stream.commentIndex = cls(stream)
+	return index
+
+    def select(self, start, stop):
+	""" Returns the comment tokens in the slice [start:stop] of the stream. """
+	start, stop, step = slice(start, stop).indices(self.size)
+	positions = self.positions
+	lo = bisect_left(positions, start)
+	hi = bisect_left(positions, stop, lo)
+	return self.comments[lo:hi]
+
+
 class TreeAdaptor(CommonTreeAdaptor):
     """ TreeAdaptor -> defered tree node creator (for parsers) """
 
@@ -160,11 +197,31 @@ class LocalTree(CommonTree):
 	yield colors.black(item)
 
     def dump(self, fd, level=0):
-	""" Writes a debug representation of this tree to the given file. """
+	""" Writes a debug representation of this tree to the given file.
+
+	The tree and its token stream are walked together, once, so the
+	cost is linear in the size of the tree plus the number of tokens.
+	Each comment is written before the first node that starts after
+	it, or after the last node that ends after it.
+	"""
 	extras = lambda x, y:x and (x != y)
-	seen, nform = set(), '{0}{1}{2}{3}'
-	def innerDump(root, offset):
+	nform = '{0}{1}{2}{3}'
+	index = CommentIndex.forStream(self.parser.input)
+	cursor = [0]
+	def writeComments(stop, indent):
+	    stop = slice(0, stop).indices(index.size)[1]
+	    if stop > cursor[0]:
+		for com in index.select(cursor[0], stop):
+		    for line in self.colorComments(com):
+			print >> fd, '{0}{1}'.format(indent, line)
+		cursor[0] = stop
+	stack = [(self, level, False)]
+	while stack:
+	    root, offset, done = stack.pop()
 	    token, indent = root.token, '    ' * offset
+	    if done:
+		writeComments(root.tokenStopIndex, indent)
+		continue
 	    start, stop = root.tokenStartIndex, root.tokenStopIndex
 	    idxes, ttyp = '', tokens.map.get(token.type, '?')
             line = token.line
@@ -179,16 +236,10 @@ class LocalTree(CommonTree):
 	    args = [indent, self.colorType(ttyp), '', idxes, '']
 	    if extras(token.text, ttyp):
 		args[2] = ' ' + self.colorText(ttyp, token.text)
-	    for com in self.selectComments(start, seen):
-		for line in self.colorComments(com):
-		    print >> fd, '{0}{1}'.format(indent, line)
+	    writeComments(start, indent)
 	    print >> fd, nform.format(*args)
-	    for child in root.getChildren():
-		innerDump(child, offset+1)
-	    for com in self.selectComments(root.tokenStopIndex, seen):
-		for line in self.colorComments(com):
-		    print >> fd, '{0}{1}'.format(indent, line)
-	innerDump(self, level)
+	    stack.append((root, offset, True))
+	    stack.extend((child, offset+1, False) for child in reversed(root.getChildren()))
 
     def dumps(self, level=0):
 	""" Dump this token to a string. """
@@ -201,13 +252,35 @@ class LocalTree(CommonTree):
 	get = lambda v:getattr(self, v, None)
 	return LocalTree(self, get('lexer'), get('parser'))
 
+    @property
+    def dottedName(self):
+	""" Returns the dotted name (like 'System.out') of this tree, or None. """
+	if self.type == tokens.IDENT:
+	    return self.text
+	if self.type == tokens.DOT and len(self.children) == 2:
+	    left, right = self.children
+	    name = left.dottedName if right.type == tokens.IDENT else None
+	    if name:
+		return name + '.' + right.text
+	return None
+
     def findChildren(self, pred=lambda c:True):
-	""" Depth-first search that yields nodes meeting the predicate. """
-	for child in self.children:
-	    if pred(child):
-		yield child
-	    for sub in child.findChildren(pred):
-		yield sub
+	""" Depth-first search that yields nodes meeting the predicate.
+
+	The search keeps an iterator over the children of each level on
+	an explicit stack, so deep trees do not grow the Python stack.
+	Nodes are yielded in pre-order, and the children of a node are
+	read after the node is yielded.
+	"""
+	stack = [iter(self.children)]
+	while stack:
+	    for child in stack[-1]:
+		if pred(child):
+		    yield child
+		stack.append(iter(child.children))
+		break
+	    else:
+		stack.pop()
 
     def findChildrenOfType(self, type):
 	""" Depth-first search that yields nodes of the given type. """
@@ -244,8 +317,8 @@ class LocalTree(CommonTree):
 
     def selectComments(self, stop, memo):
 	""" Returns the comment tokens for this tree up to the given index. """
-	pred = lambda k:k.type in tokens.commentTypes and k.index not in memo
-	ctoks = [t for t in self.parser.input.tokens[0:stop] if pred(t)]
+	comments = CommentIndex.forStream(self.parser.input).select(0, stop)
+	ctoks = [t for t in comments if t.index not in memo]
 	memo.update(t.index for t in ctoks)
 	return ctoks
 
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.lang.fastlexer -> regular expression lexer for Java sources. """
+##
+# The generated `JavaLexer` predicts and matches each token one
+# character at a time, in Python.  `FastLexer` matches the same lexer
+# rules (the LEXER section of Java.g) with one precompiled regular
+# expression instead, and emits the same tokens:  `CommonToken`
+# instances with the same types, channels, start and stop indexes,
+# lines and positions in the line.  As with `JavaLexer`, whitespace is
+# one token per character, and whitespace and comments are on the
+# hidden channel.
+#
+# It is a token source, so it can be given to a `TokenStream` in place
+# of `JavaLexer`:
+#
+#     lexer = FastLexer(StringStream(source))
+#     parser = Parser(TokenStream(lexer))
+#
+# The tokens are the same for valid sources.  For invalid ones, the
+# error recovery may differ:  where no rule matches, one character is
+# skipped and a warning is logged.  Like `JavaLexer`, a comment, string
+# or character literal that is not closed before the end of the source
+# is dropped, and so is a line comment without a newline at the end.
+# Where a line comment has a carriage return without a newline, or a
+# string or character literal is malformed, the text up to and
+# including the offending character is dropped (an invalid escape
+# drops only the backslash), as the ANTLR runtime recovers.
+
+from logging import getLogger
+from re import compile as recompile
+
+from antlr3 import CommonToken, DEFAULT_CHANNEL, EOF, HIDDEN_CHANNEL
+
+from java2python.lang.base import tokens
+
+
+## warnings go to the java2python logger, where translations collect them.
+warning = getLogger(__name__).warning
+
+
+## token names of the operators and separators of the grammar
+operators = {
+    '&' : 'AND', '&=' : 'AND_ASSIGN', '=' : 'ASSIGN', '@' : 'AT',
+    '>>>' : 'BIT_SHIFT_RIGHT', '>>>=' : 'BIT_SHIFT_RIGHT_ASSIGN', ':' : 'COLON',
+    ',' : 'COMMA', '--' : 'DEC', '/' : 'DIV', '/=' : 'DIV_ASSIGN', '.' : 'DOT',
+    '.*' : 'DOTSTAR', '...' : 'ELLIPSIS', '==' : 'EQUAL', '>=' : 'GREATER_OR_EQUAL',
+    '>' : 'GREATER_THAN', '++' : 'INC', '[' : 'LBRACK', '{' : 'LCURLY',
+    '<=' : 'LESS_OR_EQUAL', '<' : 'LESS_THAN', '&&' : 'LOGICAL_AND',
+    '!' : 'LOGICAL_NOT', '||' : 'LOGICAL_OR', '(' : 'LPAREN', '-' : 'MINUS',
+    '-=' : 'MINUS_ASSIGN', '%' : 'MOD', '%=' : 'MOD_ASSIGN', '~' : 'NOT',
+    '!=' : 'NOT_EQUAL', '|' : 'OR', '|=' : 'OR_ASSIGN', '+' : 'PLUS',
+    '+=' : 'PLUS_ASSIGN', '?' : 'QUESTION', ']' : 'RBRACK', '}' : 'RCURLY',
+    ')' : 'RPAREN', ';' : 'SEMI', '<<' : 'SHIFT_LEFT', '<<=' : 'SHIFT_LEFT_ASSIGN',
+    '>>' : 'SHIFT_RIGHT', '>>=' : 'SHIFT_RIGHT_ASSIGN', '*' : 'STAR',
+    '*=' : 'STAR_ASSIGN', '^' : 'XOR', '^=' : 'XOR_ASSIGN',
+}
+
+keywords = (
+    'abstract assert boolean break byte case catch char class continue '
+    'default do double else enum extends false final finally float for if '
+    'implements instanceof interface import int long native new null package '
+    'private protected public return short static strictfp super switch '
+    'synchronized this throw throws transient true try void volatile while'
+).split()
+
+
+## the rules of the grammar for the tokens on the hidden channel
+hiddenKinds = ('WS', 'COMMENT', 'JAVADOC_COMMENT', 'LINE_COMMENT')
+
+## the rules of the grammar for literals and identifiers
+literalKinds = (
+    'HEX_LITERAL', 'FLOATING_POINT_LITERAL', 'OCTAL_LITERAL', 'DECIMAL_LITERAL',
+    'CHARACTER_LITERAL', 'STRING_LITERAL', 'IDENT',
+)
+
+
+## the character ranges of JAVA_ID_START
+identStart = (
+    (0x24, 0x24), (0x41, 0x5a), (0x5f, 0x5f), (0x61, 0x7a), (0xc0, 0xd6),
+    (0xd8, 0xf6), (0xf8, 0xff), (0x100, 0x1fff), (0x3040, 0x318f),
+    (0x3300, 0x337f), (0x3400, 0x3d2d), (0x4e00, 0x9fff), (0xf900, 0xfaff),
+)
+
+
+def charClass(ranges):
+    """ Returns a regular expression character class for the given ranges. """
+    items = (unichr(a) if a == b else unichr(a) + '-' + unichr(b) for a, b in ranges)
+    return u'[' + u''.join(items) + u']'
+
+
+def masterPattern():
+    """ Returns the regular expression for all of the tokens, one group per kind.
+
+    The alternatives are tried in order, so that each one matches what
+    the lexer rules of the grammar would match at the same position.
+    """
+    escape = r'\\(?:[btnfr"\'\\]|u[0-9a-fA-F]{4}|[0-3][0-7][0-7]|[0-7][0-7]|[0-7])'
+    partial = r'(?:\\(?:u[0-9a-fA-F]{0,3})?)?'
+    badEscape = r'\\(?![btnfr"\'\\0-7u])|\\u[0-9a-fA-F]{0,3}[^0-9a-fA-F]'
+    exponent, suffix = r'[eE][+-]?[0-9]+', r'[fFdD]'
+    start = charClass(identStart)
+    part = charClass(identStart + ((0x30, 0x39), ))
+    ops = sorted(operators, key=lambda op:-len(op))
+    kinds = [
+	('WS', r'[ \r\t\f\n]+'),
+	('JAVADOC_COMMENT', r'/\*\*[\s\S]*?\*/'),
+	('COMMENT', r'/\*[^*][\s\S]*?\*/'),
+	('LINE_COMMENT', r'//[^\n\r]*\r?\n'),
+	('HEX_LITERAL', r'0[xX][0-9a-fA-F]+[lL]?'),
+	('FLOATING_POINT_LITERAL',
+	 r'[0-9]+(?:\.[0-9]*(?:{0})?{1}?|{0}{1}?|{1})|\.[0-9]+(?:{0})?{1}?'.format(exponent, suffix)),
+	('OCTAL_LITERAL', r'0[0-7]+[lL]?'),
+	('DECIMAL_LITERAL', r'(?:0|[1-9][0-9]*)[lL]?'),
+	('CHARACTER_LITERAL', r"'(?:{0}|[^'\\])'".format(escape)),
+	('STRING_LITERAL', r'"(?:{0}|[^\\"])*"'.format(escape)),
+	('UNTERMINATED', r'/\*[\s\S]*\Z|//[^\n\r]*\r?\Z|"(?:{0}|[^\\"])*{1}\Z|\'(?:{0}|[^\'\\])?{1}\Z'
+	 .format(escape, partial)),
+	('MISMATCHED', r'//[^\n\r]*\r[^\n]|"(?:{0}|[^\\"])*(?:{1})|\'(?:{1}|(?:{0}|[^\'\\])?[\s\S])'
+	 .format(escape, badEscape)),
+	('IDENT', start + part + '*'),
+	('OPERATOR', '|'.join('\\' + '\\'.join(op) for op in ops)),
+    ]
+    return u'|'.join(u'(?P<{0}>{1})'.format(name, regex) for name, regex in kinds)
+
+
+class FastLexer(object):
+    """ FastLexer -> token source that matches Java tokens with a regular expression. """
+
+    pattern = kindTypes = operatorTypes = keywordTypes = None
+
+    def __init__(self, input):
+	self.input = input
+	self.text = input.substring(0, input.size() - 1) if input.size() else u''
+	self.pending = self.iterTokens()
+	if FastLexer.pattern is None:
+	    FastLexer.setup()
+
+    @classmethod
+    def setup(cls):
+	""" Compiles the pattern and maps its groups and strings to token types. """
+	cls.kindTypes = dict((name, getattr(tokens, name)) for name in hiddenKinds + literalKinds)
+	cls.operatorTypes = dict((op, getattr(tokens, name)) for op, name in operators.items())
+	cls.keywordTypes = dict((word, getattr(tokens, word.upper())) for word in keywords)
+	cls.pattern = recompile(masterPattern())
+
+    def getSourceName(self):
+	""" Returns the name of the input stream. """
+	return self.input.getSourceName()
+
+    def nextToken(self):
+	""" Returns the next token, or an EOF token at the end of the input. """
+	return self.pending.next()
+
+    def iterTokens(self):
+	""" Yields the tokens of the input, then EOF tokens. """
+	text, input, size = self.text, self.input, len(self.text)
+	match, kindTypes = self.pattern.match, self.kindTypes
+	operatorTypes, keywordTypes = self.operatorTypes, self.keywordTypes
+	identType = kindTypes['IDENT']
+	pos, line, lineStart = 0, 1, 0
+	while pos < size:
+	    m = match(text, pos)
+	    if m is None:
+		warning('line %s:%s no token matches %r', line, pos - lineStart, text[pos])
+		pos += 1
+		continue
+	    kind, end = m.lastgroup, m.end()
+	    if kind == 'UNTERMINATED':
+		warning('line %s:%s unterminated token at end of input', line, pos - lineStart)
+		break
+	    if kind == 'MISMATCHED':
+		warning('line %s:%s mismatched character %r', line, end - 1 - lineStart, text[end - 1])
+		newlines = text.count('\n', pos, end)
+		if newlines:
+		    line, lineStart = line + newlines, text.rindex('\n', pos, end) + 1
+		pos = end
+		continue
+	    channel = HIDDEN_CHANNEL if kind in hiddenKinds else DEFAULT_CHANNEL
+	    if kind == 'WS':
+		wsType = kindTypes['WS']
+		for index in xrange(pos, end):
+		    token = CommonToken(type=wsType, channel=channel, input=input,
+					start=index, stop=index)
+		    token.line, token.charPositionInLine = line, index - lineStart
+		    yield token
+		    if text[index] == '\n':
+			line, lineStart = line + 1, index + 1
+		pos = end
+		continue
+	    if kind == 'OPERATOR':
+		tokType = operatorTypes[m.group()]
+	    elif kind == 'IDENT':
+		tokType = keywordTypes.get(m.group(), identType)
+	    else:
+		tokType = kindTypes[kind]
+	    token = CommonToken(type=tokType, channel=channel, input=input, start=pos, stop=end - 1)
+	    token.line, token.charPositionInLine = line, pos - lineStart
+	    yield token
+	    newlines = text.count('\n', pos, end)
+	    if newlines:
+		line, lineStart = line + newlines, text.rindex('\n', pos, end) + 1
+	    pos = end
+	while True:
+	    token = CommonToken(type=EOF, channel=DEFAULT_CHANNEL, input=input, start=size, stop=size)
+	    token.line, token.charPositionInLine = line, size - lineStart
+	    yield token
@@ -65,6 +65,16 @@ class Selector(object):
         """
 	return AnySibling(self, other)
 
+    def nodeTypes(self):
+        """ Returns the token types of the nodes this selector matches at.
+
+        A selector is called with a node and may yield that node or
+        nodes related to it.  This method returns the set of token
+        types the called node must have for anything to be yielded, or
+        None if the selector can match at a node of any type.
+        """
+        return None
+
     def walk(self, tree):
         """ Select items from the tree and from the tree children. """
         for item in self(tree):
@@ -110,6 +120,11 @@ class Token(Selector):
         if all(match_or_call(k, v) for k, v in items if v is not None):
             yield tree
 
+    def nodeTypes(self):
+        """ Returns the token type if it was given as a constant. """
+        key = self.attrs.get('type')
+        return set([key]) if isinstance(key, (int, long)) else None
+
     def __str__(self):
         items = self.attrs.items()
         keys = ('{}={}'.format(k, v) for k, v in items if v is not None)
@@ -136,6 +151,10 @@ class Nth(Selector):
 	    for child in matches:
 		yield child
 
+    def nodeTypes(self):
+	""" Returns the token types of E; the children are selected there. """
+	return self.e.nodeTypes()
+
     def __str__(self):
 	return 'Nth({0})[{1}]'.format(self.e, self.key)
 
@@ -152,6 +171,10 @@ class Child(Selector):
 	    for etree in self.e(tree.parent):
 		yield ftree
 
+    def nodeTypes(self):
+	""" Returns the token types of F. """
+	return self.f.nodeTypes()
+
     def __str__(self):
 	return 'Child({0} > {1})'.format(self.e, self.f)
 
@@ -170,6 +193,10 @@ class Type(Selector):
 	    if self.value is None or self.value == tree.token.text:
 		yield tree
 
+    def nodeTypes(self):
+	""" Returns the token type T. """
+	return set([self.key])
+
     def __str__(self):
         val = '' if self.value is None else '={0}'.format(self.value)
 	return 'Type({0}{1}:{2})'.format(tokens.map[self.key], val, self.key)
@@ -202,6 +229,10 @@ class Descendant(Selector):
 		    yield root
 		ftree = ftree.parent
 
+    def nodeTypes(self):
+	""" Returns the token types of F. """
+	return self.f.nodeTypes()
+
     def __str__(self):
 	return 'Descendant({0} & {1})'.format(self.e, self.f)
 
@@ -224,6 +255,10 @@ class AdjacentSibling(Selector):
             for child in self.e(previous):
                 yield ftree
 
+    def nodeTypes(self):
+	""" Returns the token types of F. """
+	return self.f.nodeTypes()
+
     def __str__(self):
 	return 'AdjacentSibling({} + {})'.format(self.e, self.f)
 
@@ -246,5 +281,9 @@ class AnySibling(Selector):
                 for child in self.e(prev):
                     yield ftree
 
+    def nodeTypes(self):
+	""" Returns the token types of F. """
+	return self.f.nodeTypes()
+
     def __str__(self):
 	return 'AnySibling({} / {})'.format(self.e, self.f)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from functools import partial
+from os import environ, path
 
 
 class FS(object):
@@ -54,3 +55,17 @@ class colors:
     red = partial(escape, 'RED')
     white = partial(escape, 'WHITE')
     yellow = partial(escape, 'YELLOW')
+
+
+def defaultCacheDir():
+    """ Returns the default cache directory for this user. """
+    base = environ.get('XDG_CACHE_HOME') or path.join(path.expanduser('~'), '.cache')
+    return path.join(base, 'j2py')
+
+
+def checkSyntax(source):
+    """ Returns None if the source compiles, otherwise the SyntaxError. """
+    try:
+	compile(source, '<string>', 'exec')
+    except (SyntaxError, ), exc:
+	return exc
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.lib.client -> thin client for the translation server. """
+##
+# This module sends translation requests to a server started with
+# `j2py --serve` (see `java2python.compiler.server` for the protocol).
+# It imports neither the compiler nor the parser, so a client that
+# gets its output from a server never loads them.
+
+from errno import ECONNREFUSED, ENOENT
+from json import dumps, loads
+from logging import debug, warning
+from os import path
+from socket import AF_UNIX, SOCK_STREAM, error as SocketError, socket
+
+from java2python.lib import defaultCacheDir
+
+
+def defaultSocketName():
+    """ Returns the default socket file name for this user. """
+    return path.join(defaultCacheDir(), 'j2py.sock')
+
+
+class ServerError(Exception):
+    """ ServerError -> raised by the client when the server reports an error. """
+
+
+def translateRemote(source, configs, filename=None, name=None, address=None):
+    """ Translates the source with a server; returns None if none is running.
+
+    Config names that refer to files are sent as absolute names so the
+    server can find them.  Socket errors (no server, a stale or
+    unreadable socket, or a connection lost during the exchange) are
+    logged and return None, so the caller can translate in process.
+    Raises ServerError when the server reports an error.
+    """
+    address = address or defaultSocketName()
+    configs = [path.abspath(n) if path.exists(n) else n for n in configs]
+    filename = path.abspath(filename) if filename else None
+    request = dict(source=source, configs=configs, filename=filename, name=name)
+    sock = socket(AF_UNIX, SOCK_STREAM)
+    try:
+	sock.connect(address)
+	fh = sock.makefile('rwb')
+	fh.write(dumps(request) + '\n')
+	fh.flush()
+	response = loads(fh.readline() or '{"error": "no response from server"}')
+	fh.close()
+    except (SocketError, ), exc:
+	log = debug if exc.errno in (ENOENT, ECONNREFUSED) else warning
+	log('no translation from server at %s: %s', address, exc)
+	return None
+    finally:
+	sock.close()
+    if 'error' in response:
+	raise ServerError(response['error'])
+    return response['output']
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.lib.instrument -> call counts and times of handlers and accept methods. """
+##
+# This module records where the time of a translation goes, in terms
+# of the config handlers and visitor methods instead of single Python
+# functions.  Install a recorder with `enable`, translate, and read the
+# results from it:
+#
+#     recorder = enable()
+#     translator.translate(source)
+#     disable()
+#     print '\n'.join(recorder.table())
+#
+# While a recorder is installed, these calls are timed:
+#
+# * the config handlers of the templates (Prologue, Head, Epilogue,
+#   Output, Base, Param, PostWalk mutators, and the single handlers
+#   like VariableNaming), keyed by the config name and the handler;
+#
+# * the AST transforms and their selectors, keyed by the transform
+#   and the token type the selector starts from;
+#
+# * the visitor accept methods, keyed by the method and the token type
+#   of the accepted node.
+#
+# Handlers that return generators are timed while they are iterated,
+# so the time of a generator handler includes the work done for each
+# item it yields.
+#
+# Nothing is wrapped while no recorder is installed.  The only cost
+# left in that case is a check of the `recorder` global when the
+# handler chains of a config are resolved, which happens once per
+# config and template type.
+
+from json import dumps
+from time import time
+from types import GeneratorType
+
+
+## the installed recorder, or None
+recorder = None
+
+
+def enable(rec=None):
+    """ Installs the given (or a new) recorder and returns it. """
+    global recorder
+    disable()
+    recorder = rec if rec is not None else Recorder()
+    from java2python.compiler.template import Factory
+    for cls in set(Factory.types.values()):
+	if hasattr(cls, 'acceptorTable'):
+	    acceptors = recorder.originals[cls] = cls.acceptorTable()
+	    cls.acceptors = recorder.timedAcceptors(cls, acceptors)
+    return recorder
+
+
+def disable():
+    """ Removes the installed recorder, if any, and returns it. """
+    global recorder
+    rec, recorder = recorder, None
+    if rec is not None:
+	for cls, acceptors in rec.originals.items():
+	    cls.acceptors = acceptors
+	rec.originals.clear()
+	for mapping, key in rec.derived:
+	    mapping.pop(key, None)
+	del rec.derived[:]
+    return rec
+
+
+def callableName(func):
+    """ Returns a short, readable name for a handler or other callable. """
+    if isinstance(func, (basestring, )):
+	return repr(func)
+    func = getattr(func, 'func', func) # partials
+    name = getattr(func, '__name__', None)
+    if name is None:
+	return repr(func)
+    module = getattr(func, '__module__', None) or ''
+    if module.startswith('java2python.'):
+	module = module.split('.')[-1]
+    return '{0}.{1}'.format(module, name) if module else name
+
+
+class Recorder(object):
+    """ Recorder -> call counts and cumulative times by key.
+
+    Each key is a tuple of (kind, name, detail), like ('accept',
+    'Expression.acceptIdent', 'IDENT') or ('handler',
+    'classHeadHandlers', 'basic.simpleDocString').
+
+    Values derived with timed callables, like the handler chains kept
+    in `Config.derived`, are stored with `storeDerived`, so `disable`
+    can remove them along with the recorder.
+    """
+    def __init__(self):
+	self.calls, self.seconds, self.originals = {}, {}, {}
+	self.derived = []
+
+    def storeDerived(self, mapping, key, value):
+	""" Stores a value in a mapping until this recorder is disabled. """
+	mapping[key] = value
+	self.derived.append((mapping, key))
+	return value
+
+    def add(self, key, seconds, calls=1):
+	""" Adds the given time and number of calls to the given key. """
+	self.calls[key] = self.calls.get(key, 0) + calls
+	self.seconds[key] = self.seconds.get(key, 0.0) + seconds
+
+    def timed(self, key, func):
+	""" Returns a callable that records the calls of the given one. """
+	add, timedIter = self.add, self.timedIter
+	def wrapper(*args, **kwds):
+	    start = time()
+	    try:
+		value = func(*args, **kwds)
+	    finally:
+		elapsed = time() - start
+	    if isinstance(value, GeneratorType):
+		return timedIter(key, value, elapsed)
+	    add(key, elapsed)
+	    return value
+	wrapper.func = func
+	return wrapper
+
+    def timedIter(self, key, items, elapsed):
+	""" Yields the given items, timing the work done to produce each. """
+	try:
+	    while True:
+		start = time()
+		try:
+		    item = items.next()
+		except (StopIteration, ):
+		    break
+		finally:
+		    elapsed += time() - start
+		yield item
+	finally:
+	    self.add(key, elapsed)
+
+    def timedHandler(self, name, handler, value=None):
+	""" Returns the given config handler, timed under the config name.
+
+	The handler is named after the given config value, if any.
+	"""
+	value = handler if value is None else value
+	return self.timed(('handler', name, callableName(value)), handler)
+
+    def timedAcceptors(self, cls, acceptors):
+	""" Returns a copy of the accept table of a visitor class with timed methods. """
+	from java2python.lang import tokens
+	timed = {}
+	for tokType, call in acceptors.items():
+	    name = '{0}.{1}'.format(cls.__name__, call.__name__)
+	    timed[tokType] = self.timed(('accept', name, tokens.map.get(tokType)), call)
+	return timed
+
+    def timedTransforms(self, table, others):
+	""" Returns a copy of a transform table with timed selectors and transforms. """
+	from java2python.lang import tokens
+	def timedPairs(pairs, tokType):
+	    tokName = tokens.map.get(tokType) if tokType is not None else None
+	    return [(self.timed(('selector', str(selector), tokName), selector),
+		     self.timed(('transform', callableName(call), tokName), call))
+		    for selector, call in pairs]
+	timedTable = dict((k, timedPairs(v, k)) for k, v in table.items())
+	return timedTable, timedPairs(others, None)
+
+    def rows(self):
+	""" Returns a list of (key, calls, seconds), slowest first. """
+	seconds = self.seconds
+	keys = sorted(seconds, key=lambda k:(-seconds[k], k))
+	return [(key, self.calls[key], seconds[key]) for key in keys]
+
+    def table(self):
+	""" Returns the lines of a table of the recorded calls, slowest first. """
+	lines = ['{0:>10} {1:>8} {2:>10}  {3}'.format('seconds', 'calls', 'us/call', 'key')]
+	for key, calls, seconds in self.rows():
+	    perCall = (seconds / calls * 1e6) if calls else 0.0
+	    name = ' '.join(part for part in key if part)
+	    lines.append('{0:>10.4f} {1:>8} {2:>10.1f}  {3}'.format(seconds, calls, perCall, name))
+	return lines
+
+    def json(self):
+	""" Returns the recorded calls as a JSON string, slowest first. """
+	items = [dict(kind=key[0], name=key[1], detail=key[2], calls=calls, seconds=seconds)
+		 for key, calls, seconds in self.rows()]
+	return dumps(items, indent=1)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" java2python.lib.subs -> compiled regular expression substitutions. """
+##
+# This module applies a list of (pattern, replacement) pairs to a text
+# with the same result as calling `re.sub` for each pair in turn, but
+# with less work:
+#
+# * Each pattern is compiled once, when the engine is created.
+#
+# * Patterns that cannot match across a line break are applied line
+#   by line.  Consecutive patterns of this kind are applied together in
+#   one pass over the lines, and each one sees only the short line it
+#   works on instead of the whole text.  Patterns that may match a
+#   newline, or that use anchors or lookarounds, are applied to the
+#   whole text as before.
+#
+# * When a pattern has a literal part that every match must contain
+#   (like '.equals(' in r'(.*?)\.equals\((.*?)\)'), the pattern is
+#   only applied to lines (or texts) containing that literal.
+#
+# The engine also keeps the total time spent in each pattern.
+
+from re import compile as recompile, DOTALL, IGNORECASE
+from sre_constants import (
+    ANY, ASSERT, ASSERT_NOT, AT, AT_BOUNDARY, AT_NON_BOUNDARY,
+    AT_LOC_BOUNDARY, AT_LOC_NON_BOUNDARY, AT_UNI_BOUNDARY, AT_UNI_NON_BOUNDARY,
+    BRANCH, CATEGORY, CATEGORY_LINEBREAK, CATEGORY_NOT_DIGIT, CATEGORY_NOT_WORD,
+    CATEGORY_SPACE, CATEGORY_UNI_LINEBREAK, CATEGORY_UNI_NOT_DIGIT,
+    CATEGORY_UNI_NOT_WORD, CATEGORY_UNI_SPACE, CATEGORY_LOC_NOT_WORD,
+    GROUPREF, GROUPREF_EXISTS, IN, LITERAL, MAX_REPEAT, MIN_REPEAT,
+    NEGATE, NOT_LITERAL, RANGE, SUBPATTERN, error as PatternError,
+)
+from sre_parse import parse
+from time import time
+
+
+newline = ord('\n')
+
+boundaries = (
+    AT_BOUNDARY, AT_NON_BOUNDARY, AT_LOC_BOUNDARY, AT_LOC_NON_BOUNDARY,
+    AT_UNI_BOUNDARY, AT_UNI_NON_BOUNDARY,
+)
+
+newlineCategories = (
+    CATEGORY_LINEBREAK, CATEGORY_NOT_DIGIT, CATEGORY_NOT_WORD, CATEGORY_SPACE,
+    CATEGORY_UNI_LINEBREAK, CATEGORY_UNI_NOT_DIGIT, CATEGORY_UNI_NOT_WORD,
+    CATEGORY_UNI_SPACE, CATEGORY_LOC_NOT_WORD,
+)
+
+
+def matchesNewline(items):
+    """ True if the given character set items can match a newline. """
+    negate, found = False, False
+    for op, av in items:
+	if op == NEGATE:
+	    negate = True
+	elif op == LITERAL:
+	    found = found or av == newline
+	elif op == RANGE:
+	    found = found or av[0] <= newline <= av[1]
+	elif op == CATEGORY:
+	    found = found or av in newlineCategories
+	else:
+	    return True
+    return found != negate
+
+
+def isLineSafe(data, flags):
+    """ True if the parsed pattern can only match text within one line.
+
+    Anchors (other than word boundaries) and lookarounds make a pattern
+    unsafe as well, because they would test the ends of each line
+    instead of the ends of the whole text.
+    """
+    for op, av in data:
+	if op == LITERAL:
+	    if av == newline:
+		return False
+	elif op == NOT_LITERAL:
+	    if av != newline:
+		return False
+	elif op == ANY:
+	    if flags & DOTALL:
+		return False
+	elif op == IN:
+	    if matchesNewline(av):
+		return False
+	elif op == AT:
+	    if av not in boundaries:
+		return False
+	elif op == SUBPATTERN:
+	    if not isLineSafe(av[-1], flags):
+		return False
+	elif op in (MAX_REPEAT, MIN_REPEAT):
+	    if not isLineSafe(av[2], flags):
+		return False
+	elif op == BRANCH:
+	    if not all(isLineSafe(branch, flags) for branch in av[1]):
+		return False
+	elif op == GROUPREF_EXISTS:
+	    if not all(isLineSafe(branch, flags) for branch in av[1:] if branch):
+		return False
+	elif op != GROUPREF:
+	    return False
+    return True
+
+
+def requiredLiteral(data, flags):
+    """ Returns the longest literal that every match must contain, or None.
+
+    Only literals outside of repeats and branches are considered.  The
+    literal is returned when it is plain ASCII, so it can be searched
+    for in both byte and unicode strings.
+    """
+    if flags & IGNORECASE:
+	return None
+    runs, run = [], []
+
+    def scan(data):
+	for op, av in data:
+	    if op == LITERAL:
+		run.append(av)
+	    elif op == SUBPATTERN:
+		scan(av[-1])
+	    else:
+		runs.append(run[:])
+		del run[:]
+
+    scan(data)
+    runs.append(run)
+    runs = [r for r in runs if r and max(r) < 128]
+    if not runs:
+	return None
+    return ''.join(chr(c) for c in max(runs, key=len))
+
+
+class Sub(object):
+    """ Sub -> one compiled substitution. """
+
+    def __init__(self, pattern, repl):
+	self.pattern, self.repl = pattern, repl
+	self.regex = regex = recompile(pattern) if isinstance(pattern, basestring) else pattern
+	try:
+	    parsed = parse(regex.pattern, regex.flags)
+	except (PatternError, ):
+	    self.lineSafe, self.literal = False, None
+	else:
+	    flags = parsed.pattern.flags
+	    self.lineSafe = isLineSafe(parsed.data, flags)
+	    self.literal = requiredLiteral(parsed.data, flags)
+
+    def __repr__(self):
+	return 'Sub({0!r})'.format(getattr(self.pattern, 'pattern', self.pattern))
+
+
+class SubsEngine(object):
+    """ SubsEngine -> applies a list of substitutions in order.
+
+    Calling the engine with a text returns the same value as applying
+    `re.sub(pattern, repl, text)` for each pair in turn.
+    """
+
+    def __init__(self, subs):
+	self.subs = [Sub(pattern, repl) for pattern, repl in subs]
+	self.steps, self.timings = [], dict((sub, 0.0) for sub in self.subs)
+	for sub in self.subs:
+	    if sub.lineSafe and self.steps and self.steps[-1][0]:
+		self.steps[-1][1].append(sub)
+	    else:
+		self.steps.append((sub.lineSafe, [sub]))
+
+    def __call__(self, text):
+	""" Applies the substitutions to the given text and returns the result. """
+	for lineSafe, subs in self.steps:
+	    if lineSafe:
+		literals = [sub.literal for sub in subs]
+		if None not in literals and not any(l in text for l in literals):
+		    continue
+		lines = text.split('\n')
+		for index, line in enumerate(lines):
+		    lines[index] = self.apply(subs, line)
+		text = '\n'.join(lines)
+	    else:
+		text = self.apply(subs, text)
+	return text
+
+    def apply(self, subs, text):
+	""" Applies each of the given substitutions to the given text. """
+	timings = self.timings
+	for sub in subs:
+	    if sub.literal is None or sub.literal in text:
+		start = time()
+		text = sub.regex.sub(sub.repl, text)
+		timings[sub] += time() - start
+	return text
+
+    def report(self):
+	""" Returns a line with the total time of each pattern, slowest first. """
+	items = sorted(self.timings.items(), key=lambda item:-item[1])
+	return ['{0:.6f}s {1!r}'.format(seconds, sub) for sub, seconds in items]
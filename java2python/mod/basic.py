@@ -2,9 +2,14 @@
 # -*- coding: utf-8 -*-
 """ java2python.mod.basic -> functions to revise generated source strings. """
 from itertools import count
-from logging import info, warn
+from logging import DEBUG, debug, getLogger, info
 from os import path
-from re import sub as rxsub
+
+from java2python.lib.subs import SubsEngine
+
+
+## warnings go to the java2python logger, where translations collect them.
+warn = getLogger(__name__).warning
 
 
 def shebangLine(module):
@@ -62,6 +67,9 @@ def namespacePackages(module, expr):
 	initfile.write('\nfrom {0} import {0}\n'.format(module.name))
     info('created __init__.py file for package %s.', expr)
 
+## writes files, so translations that use it are not cached.
+namespacePackages.hasSideEffects = True
+
 
 def enumConstInts(enum, index, name):
     return str(index)
@@ -92,30 +100,59 @@ def scriptMainStanza(module):
 
 
 def outputSubs(obj, text):
+    """ Applies the output subs of each config module to the text.
+
+    The subs are compiled once per config; see java2python.lib.subs.
+    The total time spent in each pattern is logged at debug level.
+    """
     subsname = '{0}OutputSubs'.format(obj.typeName)
-    subs = obj.config.every(subsname, [])
-    for sub in subs:
-	for pattern, repl in sub:
-	    text = rxsub(pattern, repl, text)
+    try:
+	engine = obj.config.derived[subsname]
+    except (KeyError, ):
+	subs = [pair for sub in obj.config.every(subsname, []) for pair in sub]
+	engine = obj.config.derived[subsname] = SubsEngine(subs)
+    text = engine(text)
+    if getLogger().isEnabledFor(DEBUG):
+	for line in engine.report():
+	    debug('output sub %s', line)
     return text
 
 
+def overloadedMethodIndex(cls):
+    """ Returns the overloaded methods of a class, grouped by name.
+
+    The index is built once per class, the first time it is needed
+    after the class has been walked.  Building it renames every
+    overload but the first in its group and adds its register
+    decorator.
+    """
+    index = getattr(cls, 'overloadedMethods', None)
+    if index is not None:
+	return index
+    groups = {}
+    for child in cls.children:
+	if child and child.isMethod:
+	    groups.setdefault(child.name, []).append(child)
+    index = cls.overloadedMethods = {}
+    for name, methods in groups.items():
+	if len(methods) == 1:
+	    continue
+	index[name] = methods
+	for i, m in enumerate(methods[1:]):
+	    args = ', '.join(p['type'] for p in m.parameters)
+	    m.decorators.append('@{0}.register({1})'.format(name, args))
+	    m.name = '{0}_{1}'.format(name, i)
+    return index
+
+
 def overloadedClassMethods(method):
     """
     NB: this implementation does not handle overloaded static (or
     class) methods, only instance methods.
     """
-    cls = method.parent
-    methods = [o for o in cls.children if o.isMethod and o.name==method.name]
-    if len(methods) == 1:
-        return
-    for i, m in enumerate(methods[1:]):
-        args = [p['type'] for p in m.parameters]
-	args = ', '.join(args)
-        m.decorators.append('@{0}.register({1})'.format(method.name, args))
-        m.name = '{0}_{1}'.format(method.name, i)
-    # for this one only:
-    yield '@overloaded'
+    methods = overloadedMethodIndex(method.parent).get(method.name)
+    if methods and methods[0] is method:
+	yield '@overloaded'
 
 
 def maybeClassMethod(method):
@@ -127,8 +164,21 @@ def maybeAbstractMethod(method):
 	yield '@abstractmethod'
 
 
-def globalNameCounter(original, counter=count()):
-    return '__{0}_{1}'.format(original, counter.next())
+nameCounter = count()
+
+
+def globalNameCounter(original):
+    return '__{0}_{1}'.format(original, nameCounter.next())
+
+
+def resetNameCounter():
+    """ restarts the numbering used by globalNameCounter.
+
+    Called before each file in a multi-file run so that generated
+    names do not depend on which files a process translated before.
+    """
+    global nameCounter
+    nameCounter = count()
 
 
 def getBsrSrc():
@@ -192,9 +242,9 @@ def zopeInterfaceBases(obj):
 
 def implAny(obj):
     for module in obj.parents(lambda x:x.isModule):
-        for name in obj.bases:
-            if any(module.find(lambda v:v.name == name)):
-                return True
+	types = module.declaredTypes
+	if any(name in types for name in obj.bases):
+	    return True
 
 
 
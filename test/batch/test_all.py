@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from java2python.compiler.batch import DuplicateOutputError, makeJobs
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+	self.dirname = tempfile.mkdtemp()
+	self.cwd = os.getcwd()
+	self.work = os.path.join(self.dirname, 'work')
+	for name in ('work/src/p/Foo.java', 'work/src/q/Foo.java', 'a/Foo.java', 'b/c/Foo.java', 'b/Bar.java'):
+	    filename = os.path.join(self.dirname, name)
+	    if not os.path.isdir(os.path.dirname(filename)):
+		os.makedirs(os.path.dirname(filename))
+	    open(filename, 'w').close()
+	os.chdir(self.work)
+
+    def tearDown(self):
+	os.chdir(self.cwd)
+	shutil.rmtree(self.dirname)
+
+    def relnames(self, *names):
+	return [job.relname for job in makeJobs(names, lambda f:[], 'out')]
+
+
+class TestDirectory(BatchTest):
+    def test(self):
+	self.assertEqual(self.relnames('src'), ['p/Foo.java', 'q/Foo.java'])
+
+
+class TestCurrentDirectory(BatchTest):
+    def test(self):
+	self.assertEqual(self.relnames('src/p/Foo.java', './src/q/Foo.java'), ['src/p/Foo.java', 'src/q/Foo.java'])
+
+
+class TestOutsideFiles(BatchTest):
+    def test(self):
+	names = self.relnames(os.path.join(self.dirname, 'a/Foo.java'), '../b/c/Foo.java', '../b/Bar.java')
+	self.assertEqual(names, ['a/Foo.java', 'b/c/Foo.java', 'b/Bar.java'])
+
+
+class TestOutsidePattern(BatchTest):
+    def test(self):
+	self.assertEqual(self.relnames('../*/Foo.java', '../b/*/Foo.java'), ['a/Foo.java', 'b/c/Foo.java'])
+
+
+class TestSingleOutsideFile(BatchTest):
+    def test(self):
+	self.assertEqual(self.relnames('../b/c/Foo.java'), ['Foo.java'])
+
+
+class TestDuplicateOutput(BatchTest):
+    def test(self):
+	os.makedirs('p')
+	open('p/Foo.java', 'w').close()
+	self.assertRaises(DuplicateOutputError, makeJobs, ['src', '.'], lambda f:[], 'out')
+	self.assertEqual(len(makeJobs(['src', 'src/p/Foo.java'], lambda f:[], 'out')), 2)
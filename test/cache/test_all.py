@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from java2python.compiler.cache import TranslationCache, configDigest, isCacheable, referencedModules
+from java2python.config import Config
+
+
+def key(n):
+    return '%040x' % n
+
+
+class CacheTest(unittest.TestCase):
+    maxBytes = 1000
+
+    def setUp(self):
+	self.dirname = tempfile.mkdtemp()
+	self.cache = TranslationCache(self.dirname, self.maxBytes)
+
+    def tearDown(self):
+	shutil.rmtree(self.dirname)
+
+    def age(self, n, seconds):
+	name = self.cache.entryName(key(n))
+	os.utime(name, (seconds, seconds))
+
+    def stored(self):
+	return sorted(n for n in range(20) if os.path.exists(self.cache.entryName(key(n))))
+
+
+class TestPutGet(CacheTest):
+    def test(self):
+	self.assertEqual(self.cache.get(key(1)), None)
+	self.cache.put(key(1), u'x = "\xe9"\n')
+	self.assertEqual(self.cache.get(key(1)), u'x = "\xe9"\n')
+	self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+
+class TestReplace(CacheTest):
+    def test(self):
+	self.cache.put(key(1), 'a' * 100)
+	self.cache.put(key(1), 'b' * 300)
+	self.assertEqual(self.cache.get(key(1)), 'b' * 300)
+	self.assertEqual(self.cache.readSize(), 300)
+
+
+class TestEvictOldest(CacheTest):
+    def test(self):
+	for n in range(4):
+	    self.cache.put(key(n), 'x' * 300)
+	    self.age(n, 1000 + n)
+	self.assertEqual(self.stored(), [1, 2, 3])
+	self.assertEqual(self.cache.readSize(), 900)
+
+
+class TestGetKeepsEntry(CacheTest):
+    def test(self):
+	for n in range(3):
+	    self.cache.put(key(n), 'x' * 300)
+	    self.age(n, 1000 + n)
+	self.cache.get(key(0))
+	self.cache.put(key(3), 'x' * 300)
+	self.assertEqual(self.stored(), [0, 2, 3])
+
+
+class TestLimitAcrossInstances(CacheTest):
+    def test(self):
+	for n in range(10):
+	    TranslationCache(self.dirname, self.maxBytes).put(key(n), 'x' * 300)
+	    self.age(n, 1000 + n)
+	self.assertEqual(self.stored(), [7, 8, 9])
+	self.assertTrue(self.cache.readSize() <= self.maxBytes)
+
+
+class TestMissingSizeMarker(CacheTest):
+    def test(self):
+	for n in range(3):
+	    self.cache.put(key(n), 'x' * 300)
+	os.remove(os.path.join(self.dirname, self.cache.sizeName))
+	self.cache.put(key(3), 'x' * 50)
+	self.assertEqual(self.cache.readSize(), 950)
+
+
+class TestEvict(CacheTest):
+    def test(self):
+	for n in range(3):
+	    self.cache.put(key(n), 'x' * 300)
+	    self.age(n, 1000 + n)
+	self.cache.maxBytes = 500
+	self.cache.evict()
+	self.assertEqual(self.stored(), [2])
+	self.assertEqual(self.cache.readSize(), 300)
+
+
+class ConfigTest(unittest.TestCase):
+    def setUp(self):
+	self.dirname = tempfile.mkdtemp()
+	sys.path.insert(0, self.dirname)
+
+    def tearDown(self):
+	sys.path.remove(self.dirname)
+	sys.modules.pop('cachehelper', None)
+	shutil.rmtree(self.dirname)
+
+    def write(self, name, text):
+	filename = os.path.join(self.dirname, name)
+	with open(filename, 'w') as fh:
+	    fh.write(text)
+	return filename
+
+
+class TestSideEffects(ConfigTest):
+    def test(self):
+	self.assertTrue(isCacheable(Config(['java2python.config.default'])))
+	name = self.write('sideeffects.py',
+			  'from java2python.mod import basic\n'
+			  'modulePackageDeclarationHandler = basic.namespacePackages\n')
+	self.assertFalse(isCacheable(Config(['java2python.config.default', name])))
+
+
+class TestReferencedModules(ConfigTest):
+    def test(self):
+	self.write('cachehelper.py', 'def handler(module):\n    yield "# one"\n')
+	name = self.write('helped.py', 'from cachehelper import handler\nmoduleEpilogueHandlers = [handler]\n')
+	config = Config([name])
+	self.assertEqual([m.__name__ for m in referencedModules(config)], ['cachehelper'])
+	digest = configDigest(config)
+	self.write('cachehelper.py', 'def handler(module):\n    yield "# two"\n')
+	self.assertNotEqual(configDigest(Config([name])), digest)
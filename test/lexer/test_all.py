@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import glob
+import os
+import unittest
+
+from java2python.compiler import Translator
+from java2python.lang import FastLexer, Lexer, StringStream, TokenStream
+
+
+testDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def tokenFields(lexerClass, source):
+    stream = TokenStream(lexerClass(StringStream(source)))
+    stream.fillBuffer()
+    return [(tok.index, tok.type, tok.channel, tok.start, tok.stop,
+	     tok.line, tok.charPositionInLine, tok.text) for tok in stream.tokens]
+
+
+class LexerTest(unittest.TestCase):
+    def assertSameTokens(self, source):
+	expected = tokenFields(Lexer, source)
+	actual = tokenFields(FastLexer, source)
+	for want, got in zip(expected, actual):
+	    self.assertEqual(want, got)
+	self.assertEqual(len(expected), len(actual))
+
+    @classmethod
+    def make(cls, source):
+	def t(self):
+	    self.assertSameTokens(source)
+	return t
+
+    @classmethod
+    def makeFile(cls, filename):
+	def t(self):
+	    self.assertSameTokens(open(filename).read())
+	return t
+
+
+class TestLiterals(LexerTest):
+    test = LexerTest.make(
+	'int a = 0x1fL + 0XAB + 017 + 0 + 0L + 08 + 123l + 1.5e-3f + 1. + .5 + 2.D'
+	' + 1e10 + 3E+2d + 2f + 3D + 10L;\n'
+	"char c = '\\n', d = '\\u0041', e = '\\177', f = '\\'', g = '\\7', h = '\"';\n"
+	'String s = "a\\"b\\\\c" + "" + "\\u00e9\\12\\0" + "\'";\n'
+    )
+
+
+class TestOperators(LexerTest):
+    test = LexerTest.make(
+	'a >>>= b >>= c >> d >>> e <<= f << g >= h <= i != j == k;\n'
+	'a += b -= c *= d /= e %= f &= g |= h ^= i && j || !k ? ~l : m++ + --n;\n'
+	'import a.b.*; @Foo void f(int... xs) { xs[0] = a.b; }\n'
+    )
+
+
+class TestComments(LexerTest):
+    test = LexerTest.make(
+	'/**/ x /** doc\n * more */ /* block\n comment */ y /*/ z */\n'
+	'a = b / c; // line comment\r\n/***/ d\t\f\r\n'
+    )
+
+
+class TestIdentifiers(LexerTest):
+    test = LexerTest.make(
+	u'class Ünïcödé { int $x_1, _y, int1, interface2, 中文; }\n'
+    )
+
+
+class TestLineCommentAtEnd(LexerTest):
+    test = LexerTest.make('a = b; // no newline')
+
+
+class TestEmpty(LexerTest):
+    test = LexerTest.make('')
+
+
+class TestUnterminated(LexerTest):
+    testComment = LexerTest.make('a = b; /* not closed\n x')
+    testJavadoc = LexerTest.make('a = b; /** not closed')
+    testString = LexerTest.make('a = "not closed;\n')
+    testEscape = LexerTest.make('a = "ends with \\')
+    testUnicode = LexerTest.make('a = "ends with \\u00')
+    testChar = LexerTest.make("c = 'a")
+    testLineComment = LexerTest.make('a = b; // no newline\r')
+
+
+class TestMismatched(LexerTest):
+    testCarriageReturn = LexerTest.make('a = b; // old mac\rc = d; // newline\r\r\ne = f;\n')
+    testBadEscape = LexerTest.make('a = "bad \\q escape" + b;\nc = "x";\n')
+    testBadUnicode = LexerTest.make('a = "bad \\u12g escape";\nb = c;\n')
+    testChar = LexerTest.make("a = 'ab' + '' + '\\q' + '\n';\nb = c;\n")
+
+
+class TestRecognitionErrors(unittest.TestCase):
+    def warnings(self, source):
+	return Translator(['java2python.config.default']).translate(source, 'A').warnings
+
+    def testLexer(self):
+	self.assertTrue(any("'#'" in m for m in self.warnings('class A { int a = 1; # }')))
+
+    def testParser(self):
+	self.assertTrue(any("'}'" in m for m in self.warnings('class A { int a = 1 }')))
+
+
+## one test per source of the test directory
+for name in sorted(glob.glob(os.path.join(testDir, '*.java')) +
+		   glob.glob(os.path.join(testDir, '*', '*.java'))):
+    testName = 'Test' + os.path.splitext(os.path.relpath(name, testDir))[0].replace(os.sep, '_')
+    globals()[testName] = type(testName, (LexerTest, ), {'test' : LexerTest.makeFile(name)})
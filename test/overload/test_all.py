@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import gc
+import unittest
+import weakref
+
+from java2python.compiler.block import Module
+from java2python.compiler.template import Factory
+from java2python.config import Config
+from java2python.mod.basic import overloadedClassMethods, overloadedMethodIndex
+
+
+class OverloadTest(unittest.TestCase):
+    def setUp(self):
+	self.module = module = Module(Config(['java2python.config.default']))
+	module.name = 'Overloads'
+	self.klass = module.factory.klass(name='A', parent=module)
+	self.f1 = self.method('f', 'int')
+	self.g = self.method('g')
+	self.f2 = self.method('f', 'String')
+	self.f3 = self.method('f', 'int', 'long')
+
+    def method(self, name, *types):
+	method = self.klass.factory.method(name=name, parent=self.klass)
+	for index, type in enumerate(types):
+	    method.addParameter(method.makeParam('arg{0}'.format(index), type))
+	return method
+
+
+class TestIndex(OverloadTest):
+    def test(self):
+	index = overloadedMethodIndex(self.klass)
+	self.assertEqual(index, {'f' : [self.f1, self.f2, self.f3]})
+	self.assertEqual([m.name for m in (self.f1, self.f2, self.f3, self.g)], ['f', 'f_0', 'f_1', 'g'])
+	self.assertEqual(self.f1.decorators, [])
+	self.assertEqual(self.f2.decorators, ['@f.register(object, String)'])
+	self.assertEqual(self.f3.decorators, ['@f.register(object, int, long)'])
+
+
+class TestIndexOnce(OverloadTest):
+    def test(self):
+	index = overloadedMethodIndex(self.klass)
+	self.assertTrue(overloadedMethodIndex(self.klass) is index)
+	self.assertEqual([m.name for m in (self.f1, self.f2, self.f3)], ['f', 'f_0', 'f_1'])
+	self.assertEqual(self.f2.decorators, ['@f.register(object, String)'])
+
+
+class TestNoOverloads(OverloadTest):
+    def test(self):
+	klass = self.module.factory.klass(name='B', parent=self.module)
+	self.klass.factory.method(name='h', parent=klass)
+	self.assertEqual(overloadedMethodIndex(klass), {})
+
+
+class TestPrologue(OverloadTest):
+    def test(self):
+	self.assertEqual(list(overloadedClassMethods(self.f1)), ['@overloaded'])
+	self.assertEqual(list(overloadedClassMethods(self.f2)), [])
+	self.assertEqual(list(overloadedClassMethods(self.f3)), [])
+	self.assertEqual(list(overloadedClassMethods(self.g)), [])
+
+
+class TestRenderTwice(OverloadTest):
+    def test(self):
+	first = unicode(self.module)
+	self.assertEqual(unicode(self.module), first)
+	self.assertEqual(first.count('@overloaded'), 1)
+	self.assertTrue('@f.register(object, String)\n' in first)
+	self.assertTrue('def f_1(self, arg0, arg1):' in first)
+
+
+class TestFactoryPerConfig(unittest.TestCase):
+    def test(self):
+	config = Config(['java2python.config.default'])
+	module = Module(config)
+	self.assertTrue(Factory.forConfig(config) is module.factory)
+	self.assertTrue(Module(config).factory is module.factory)
+	ref = weakref.ref(config)
+	del config, module
+	gc.collect()
+	self.assertTrue(ref() is None)
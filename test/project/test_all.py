@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from java2python.compiler.batch import makeJobs
+from java2python.compiler.project import ChangeSet, Manifest, isCurrent, runProject
+
+
+sources = {
+    'A.java' : 'package p;\n\npublic class A {\n}\n',
+    'B.java' : 'package q;\n\nimport p.A;\n\npublic class B {\n}\n',
+    'C.java' : 'package r;\n\npublic class C {\n}\n',
+}
+
+
+def entry(package, imports=(), types=()):
+    return dict(package=package, imports=list(imports), types=list(types))
+
+
+class TestManifestSave(unittest.TestCase):
+    def test(self):
+	dirname = tempfile.mkdtemp()
+	try:
+	    filename = os.path.join(dirname, 'manifest.json')
+	    manifest = Manifest(filename)
+	    self.assertEqual(manifest.entries, {})
+	    manifest.entries['A.java'] = entry('p', types=['A'])
+	    manifest.save()
+	    self.assertEqual(Manifest(filename).entries, {'A.java' : entry('p', types=['A'])})
+	finally:
+	    shutil.rmtree(dirname)
+
+
+class TestManifestUnreadable(unittest.TestCase):
+    def test(self):
+	dirname = tempfile.mkdtemp()
+	try:
+	    filename = os.path.join(dirname, 'manifest.json')
+	    with open(filename, 'w') as fh:
+		fh.write('{"version": ')
+	    self.assertEqual(Manifest(filename).entries, {})
+	    with open(filename, 'w') as fh:
+		fh.write('{"version": 0, "entries": {"A.java": {}}}')
+	    self.assertEqual(Manifest(filename).entries, {})
+	finally:
+	    shutil.rmtree(dirname)
+
+
+class TestChangeSet(unittest.TestCase):
+    def setUp(self):
+	self.changes = ChangeSet()
+	self.changes.add(entry('p', types=['A', 'A2']))
+	self.changes.add(entry(None, types=['Top']))
+	self.changes.add(None)
+
+    def testSamePackage(self):
+	self.assertTrue(self.changes.affects(entry('p')))
+
+    def testDefaultPackage(self):
+	self.assertTrue(self.changes.affects(entry(None)))
+
+    def testImportPackage(self):
+	self.assertTrue(self.changes.affects(entry('q', ['p'])))
+
+    def testImportType(self):
+	self.assertTrue(self.changes.affects(entry('q', ['p.A2'])))
+
+    def testImportMember(self):
+	self.assertTrue(self.changes.affects(entry('q', ['p.A.CONSTANT'])))
+
+    def testImportTypeOfDefaultPackage(self):
+	self.assertTrue(self.changes.affects(entry('q', ['Top'])))
+
+    def testUnrelated(self):
+	self.assertFalse(self.changes.affects(entry('q', ['p2.A', 'r.A', 'pA'])))
+
+
+class ProjectTest(unittest.TestCase):
+    def setUp(self):
+	self.dirname = tempfile.mkdtemp()
+	self.srcdir = os.path.join(self.dirname, 'src')
+	self.outdir = os.path.join(self.dirname, 'out')
+	os.mkdir(self.srcdir)
+	for name, source in sources.items():
+	    self.write(name, source)
+	self.manifest = Manifest(os.path.join(self.outdir, 'manifest.json'))
+	self.translate()
+
+    def tearDown(self):
+	shutil.rmtree(self.dirname)
+
+    def write(self, name, source):
+	with open(os.path.join(self.srcdir, name), 'w') as fh:
+	    fh.write(source)
+
+    def jobs(self, names=None):
+	names = [os.path.join(self.srcdir, n) for n in names] if names else [self.srcdir]
+	return makeJobs(names, lambda f:['java2python.config.default'], self.outdir)
+
+    def translate(self, names=None):
+	results = list(runProject(self.jobs(names), self.manifest))
+	for result in results:
+	    self.assertTrue(result.ok, result.error)
+	return sorted(os.path.basename(r.job.filename) for r in results)
+
+    def output(self, name):
+	return os.path.join(self.outdir, name.replace('.java', '.py'))
+
+
+class TestFirstRun(ProjectTest):
+    def test(self):
+	entries = self.manifest.entries
+	self.assertEqual(sorted(entries), ['A.java', 'B.java', 'C.java'])
+	self.assertEqual((entries['B.java']['package'], entries['B.java']['imports']), ('q', ['p.A']))
+	self.assertEqual(entries['A.java']['types'], ['A'])
+	self.assertTrue(all(os.path.exists(self.output(n)) for n in sources))
+
+
+class TestUnchanged(ProjectTest):
+    def test(self):
+	self.assertEqual(self.translate(), [])
+
+
+class TestChangedSource(ProjectTest):
+    def test(self):
+	self.write('A.java', 'package p;\n\npublic class A {\n    int x;\n}\n')
+	self.assertEqual(self.translate(), ['A.java', 'B.java'])
+	self.assertEqual(self.translate(), [])
+
+
+class TestRemovedOutput(ProjectTest):
+    def test(self):
+	os.remove(self.output('C.java'))
+	self.assertEqual(self.translate(), ['C.java'])
+
+
+class TestDeletedSource(ProjectTest):
+    def test(self):
+	os.remove(os.path.join(self.srcdir, 'A.java'))
+	self.assertEqual(self.translate(), ['B.java'])
+	self.assertEqual(sorted(self.manifest.entries), ['B.java', 'C.java'])
+	self.assertFalse(os.path.exists(self.output('A.java')))
+
+
+class TestPartialRun(ProjectTest):
+    def test(self):
+	self.assertEqual(self.translate(['C.java']), [])
+	self.assertEqual(sorted(self.manifest.entries), ['A.java', 'B.java', 'C.java'])
+	self.assertTrue(os.path.exists(self.output('A.java')))
+
+
+class TestIsCurrent(ProjectTest):
+    def test(self):
+	job = [j for j in self.jobs() if j.relname == 'C.java'][0]
+	item = self.manifest.entries['C.java']
+	digest = item['config']
+	self.assertTrue(isCurrent(item, job, digest))
+	self.assertFalse(isCurrent(item, job, 'other config'))
+	item['mtime'] -= 10
+	self.assertTrue(isCurrent(item, job, digest))
+	self.assertEqual(item['mtime'], os.stat(job.filename).st_mtime)
+	self.write('C.java', 'package r;\n\nclass C {\n}\n')
+	self.assertFalse(isCurrent(item, job, digest))
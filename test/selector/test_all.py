@@ -108,3 +108,19 @@ class TestClassIdent(SelectorTest):
     description = 'select one IDENT node that is a child of a CLASS node'
     selector = Type('CLASS') > Type('IDENT')
     test = SelectorTest.make(1)
+
+
+class TestNodeTypes(SelectorTest):
+    description = 'nodes with a match from an IDENT sibling selector are IDENT nodes'
+    selector = Type('MODIFIER_LIST') + Type('IDENT')
+
+    def test(self):
+        types = self.selector.nodeTypes()
+        self.assertEquals(types, set([tokens.IDENT]))
+        stack = [self.tree]
+        while stack:
+            node = stack.pop()
+            if any(self.selector(node)):
+                self.assertTrue(node.type in types)
+            stack.extend(node.children)
+        self.assertEquals(Token(text='foo').nodeTypes(), None)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from java2python.compiler.server import ConfigEntry, TranslationServer, translateRemote
+from java2python.config import Config
+
+
+class ServerTest(unittest.TestCase):
+    def setUp(self):
+	self.dirname = tempfile.mkdtemp()
+	self.address = os.path.join(self.dirname, 'j2py.sock')
+
+    def tearDown(self):
+	shutil.rmtree(self.dirname)
+
+    def translate(self):
+	return translateRemote('class A {}', [], name='A', address=self.address)
+
+
+class TestNoServer(ServerTest):
+    def test(self):
+	self.assertEqual(self.translate(), None)
+
+
+class TestStaleSocket(ServerTest):
+    def test(self):
+	open(self.address, 'w').close()
+	self.assertEqual(self.translate(), None)
+
+
+class TestConnectionLost(ServerTest):
+    def test(self):
+	listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	listener.bind(self.address)
+	listener.listen(1)
+	def acceptAndClose():
+	    conn, addr = listener.accept()
+	    conn.close()
+	thread = threading.Thread(target=acceptAndClose)
+	thread.start()
+	try:
+	    self.assertEqual(self.translate(), None)
+	finally:
+	    thread.join()
+	    listener.close()
+
+
+class FakeTranslation(object):
+    def __init__(self, output):
+	self.output = output
+
+
+class FakeTranslator(object):
+    def __init__(self):
+	self.config, self.sources = Config([]), []
+
+    def translate(self, source, name, filename):
+	self.sources.append(source)
+	return FakeTranslation(source.upper())
+
+
+class TestResultCache(ServerTest):
+    def setUp(self):
+	ServerTest.setUp(self)
+	self.server = TranslationServer(self.address, cacheSize=2)
+	self.fake = FakeTranslator()
+	self.server.translator = lambda names:self.fake
+
+    def tearDown(self):
+	self.server.server_close()
+	ServerTest.tearDown(self)
+
+    def handle(self, source):
+	return self.server.handle(dict(source=source, configs=[], name='A'))['output']
+
+    def test(self):
+	self.assertEqual(self.handle('a'), 'A')
+	self.handle('b')
+	self.assertEqual(self.handle('a'), 'A')
+	self.assertEqual(self.fake.sources, ['a', 'b'])
+	self.handle('c') # evicts 'b', the least recently used
+	self.handle('a')
+	self.assertEqual(self.fake.sources, ['a', 'b', 'c'])
+	self.handle('b')
+	self.assertEqual(self.fake.sources, ['a', 'b', 'c', 'b'])
+
+
+class TestConfigReload(ServerTest):
+    def writeConfig(self, value, mtime):
+	with open(self.configName, 'w') as fh:
+	    fh.write('value = {0}\n'.format(value))
+	os.utime(self.configName, (mtime, mtime))
+
+    def test(self):
+	self.configName = os.path.join(self.dirname, 'reloadconfig.py')
+	now = time.time()
+	self.writeConfig(1, now - 10)
+	entry = ConfigEntry([self.configName])
+	self.assertEqual(entry.config.last('value'), 1)
+	self.assertFalse(entry.refresh())
+	translator = entry.translator
+	self.writeConfig(2, now)
+	self.assertTrue(entry.refresh())
+	self.assertEqual(entry.config.last('value'), 2)
+	self.assertTrue(entry.translator is not translator)
+
+
+class TestClientImports(unittest.TestCase):
+    def test(self):
+	code = 'import sys, java2python.lib.client; print sorted(sys.modules)'
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+	names = eval(subprocess.check_output([sys.executable, '-c', code], env=env))
+	self.assertFalse([n for n in names if n.startswith(('antlr3', 'java2python.compiler', 'java2python.lang'))])
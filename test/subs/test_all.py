@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import re
+import unittest
+
+from java2python.config import Config
+from java2python.lib.subs import Sub, SubsEngine
+
+
+text = u'''class A(object):
+    def toString(self):
+        return self.a.equals(b) and self.c.equals(d)
+
+    def get(self, i):
+        raise IndexOutOfBoundsException("bad index: " + i)
+    # name = "x"; other = "\xe9"
+\tdef toString2(self):  pass
+'''
+
+
+subs = [
+    (r'(\s)def toString', r'\1def __str__'),
+    (r'(.*?)IndexOutOfBoundsException\((.*?)\)', r'\1IndexError(\2)'),
+    (r'(\w+)\.equals\((\w+)\)', r'\1 == \2'),
+    (r'\s+$', ''),
+    (r'^class (\w+)', r'class \1_'),
+    (r'pass\n', 'pass # done\n'),
+    (r'(?<=self\.)c\b', 'cc'),
+    (r'(?s)def get.*?raise', 'def get(self, i):\n        raise'),
+    (r'[^"]*"x"', lambda m:m.group(0).upper()),
+    (re.compile(r'NAME', re.I), 'label'),
+    (r'(a)(b)?(?(2)c|d)', r'[\1]'),
+    (r'\bi\b', 'index'),
+    (r'[\S]+\n[\S]+', 'joined'),
+]
+
+
+class TestSameAsReSub(unittest.TestCase):
+    def test(self):
+	expected = text
+	for pattern, repl in subs:
+	    expected = re.sub(pattern, repl, expected)
+	self.assertEqual(SubsEngine(subs)(text), expected)
+
+
+class TestEachSameAsReSub(unittest.TestCase):
+    def test(self):
+	for pattern, repl in subs:
+	    self.assertEqual(SubsEngine([(pattern, repl)])(text), re.sub(pattern, repl, text))
+	    self.assertEqual(SubsEngine([(pattern, repl)])(text.encode('utf-8')),
+			     re.sub(pattern, repl, text.encode('utf-8')))
+
+
+class TestShortTexts(unittest.TestCase):
+    def test(self):
+	engine = SubsEngine(subs)
+	for source in (u'', u'\n', u'nothing to see', u'a\n\nb\n'):
+	    expected = source
+	    for pattern, repl in subs:
+		expected = re.sub(pattern, repl, expected)
+	    self.assertEqual(engine(source), expected)
+	self.assertEqual(SubsEngine([])(text), text)
+
+
+class TestLineSafe(unittest.TestCase):
+    def test(self):
+	self.assertTrue(Sub(r'(\w+)\.equals\((\w+)\)', '').lineSafe)
+	self.assertTrue(Sub(r'(.*?)Exception', '').lineSafe)
+	self.assertTrue(Sub(r'\bi\b', '').lineSafe)
+	self.assertFalse(Sub(r'\s+$', '').lineSafe)
+	self.assertFalse(Sub(r'(\s)def', '').lineSafe)
+	self.assertFalse(Sub(r'(?s).', '').lineSafe)
+	self.assertFalse(Sub(r'[^"]', '').lineSafe)
+	self.assertFalse(Sub(r'(?<=a)b', '').lineSafe)
+
+
+class TestLiteral(unittest.TestCase):
+    def test(self):
+	self.assertEqual(Sub(r'(.*?)\.equals\((.*?)\)', '').literal, '.equals(')
+	self.assertEqual(Sub(r'(a|b)cd', '').literal, 'cd')
+	self.assertEqual(Sub(r'(?i)equals', '').literal, None)
+	self.assertEqual(Sub(r'\w+', '').literal, None)
+
+
+class TestConfigInvalidate(unittest.TestCase):
+    def setUp(self):
+	self.config = Config(['java2python.config.default'])
+	self.module = self.config.configs[0]
+	self.saved = self.module.indentPrefix
+
+    def tearDown(self):
+	self.module.indentPrefix = self.saved
+	self.config.invalidate()
+
+    def test(self):
+	self.config.derived['key'] = 'value'
+	self.module.indentPrefix = 'changed'
+	self.assertEqual(self.config.last('indentPrefix'), self.saved)
+	self.config.invalidate()
+	self.assertEqual(self.config.last('indentPrefix'), 'changed')
+	self.assertEqual(self.config.every('indentPrefix'), ['changed'])
+	self.assertEqual(self.config.derived, {})
+
+
+class TestConfigEvery(unittest.TestCase):
+    def test(self):
+	config = Config(['java2python.config.default', 'java2python.config.default'])
+	self.assertEqual(config.every('noSuchName', 1), [1, 1])
+	self.assertEqual(config.last('noSuchName', 2), 2)
+	module = config.configs[0]
+	module.extraName = 3
+	try:
+	    config.invalidate()
+	    self.assertEqual(config.every('extraName', 0), [3, 3])
+	finally:
+	    del module.extraName
+	config.invalidate()
+	self.assertEqual(config.every('extraName', 0), [0, 0])